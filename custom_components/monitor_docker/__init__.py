@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+import re
 from datetime import timedelta
+from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -18,9 +20,21 @@ from homeassistant.helpers.reload import async_setup_reload_service
 
 from .const import (
     API,
+    CONF_ADAPTIVE,
+    CONF_ADAPTIVE_MAX,
+    CONF_ADAPTIVE_MIN,
+    CONF_ADAPTIVE_TOLERANCE,
     CONF_CERTPATH,
+    CONF_CGROUP,
+    CONF_CGROUP_PATH,
+    CONF_CONCURRENCY,
     CONF_CONTAINERS,
     CONF_CONTAINERS_EXCLUDE,
+    CONF_DEADBAND,
+    CONF_HEARTBEAT,
+    CONF_INFO_BATCH,
+    CONF_INFO_INTERVAL,
+    CONF_INSPECT_INTERVAL,
     CONF_MEMORYCHANGE,
     CONF_PRECISION_CPU,
     CONF_PRECISION_MEMORY_MB,
@@ -30,35 +44,68 @@ from .const import (
     CONF_PREFIX,
     CONF_RENAME,
     CONF_RENAME_ENITITY,
+    CONF_RESUME,
     CONF_RETRY,
+    CONF_SCAN_INTERVALS,
     CONF_SENSORNAME,
+    CONF_STATS_STREAM,
+    CONF_TIMEOUTS,
     CONF_SWITCHENABLED,
     CONF_SWITCHNAME,
     CONF_BUTTONENABLED,
     CONF_BUTTONNAME,
     CONFIG,
     CONTAINER_INFO_ALLINONE,
+    CONTAINER_MONITOR_STATS_LIST,
+    DEFAULT_ADAPTIVE_MAX,
+    DEFAULT_ADAPTIVE_TOLERANCE,
+    DEFAULT_CGROUP_PATH,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_HEARTBEAT,
+    DEFAULT_INFO_INTERVAL,
+    DEFAULT_INSPECT_INTERVAL,
     DEFAULT_NAME,
     DEFAULT_RETRY,
+    DEFAULT_TIMEOUT_ACTION,
+    DEFAULT_TIMEOUT_INFO,
+    DEFAULT_TIMEOUT_INSPECT,
+    DEFAULT_TIMEOUT_LIST,
+    DEFAULT_TIMEOUT_STATS,
     DEFAULT_SENSORNAME,
     DEFAULT_SWITCHNAME,
     DEFAULT_BUTTONNAME,
     DOMAIN,
     MONITORED_CONDITIONS_LIST,
     PRECISION,
+    TIMEOUT_ACTION,
+    TIMEOUT_INFO,
+    TIMEOUT_INSPECT,
+    TIMEOUT_LIST,
+    TIMEOUT_STATS,
 )
-from .helpers import DockerAPI
+from .helpers import DockerAPI, DockerBackoff
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=10)
 
+
+def validPattern(value: Any) -> re.Pattern:
+    """Validate a container name or regular expression, and compile it."""
+    value = cv.string(value)
+    try:
+        return re.compile(value)
+    except re.error as err:
+        raise vol.Invalid(f"Invalid regular expression '{value}' ({err})") from err
+
+
 DOCKER_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
         vol.Optional(CONF_PREFIX, default=""): cv.string,
         vol.Optional(CONF_URL, default=None): vol.Any(cv.string, None),
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_SCAN_INTERVALS, default={}): {validPattern: cv.time_period},
         vol.Optional(CONF_MONITORED_CONDITIONS, default=[]): vol.All(
             cv.ensure_list,
             [vol.In(MONITORED_CONDITIONS_LIST)],
@@ -78,7 +125,53 @@ DOCKER_SCHEMA = vol.Schema(
         vol.Optional(CONF_BUTTONNAME, default=DEFAULT_BUTTONNAME): cv.string,
         vol.Optional(CONF_CERTPATH, default=""): cv.string,
         vol.Optional(CONF_RETRY, default=DEFAULT_RETRY): cv.positive_int,
+        vol.Optional(CONF_RESUME, default=False): cv.boolean,
+        vol.Optional(CONF_TIMEOUTS, default={}): vol.Schema(
+            {
+                vol.Optional(
+                    TIMEOUT_ACTION, default=DEFAULT_TIMEOUT_ACTION
+                ): cv.positive_int,
+                vol.Optional(
+                    TIMEOUT_INFO, default=DEFAULT_TIMEOUT_INFO
+                ): cv.positive_int,
+                vol.Optional(
+                    TIMEOUT_INSPECT, default=DEFAULT_TIMEOUT_INSPECT
+                ): cv.positive_int,
+                vol.Optional(
+                    TIMEOUT_LIST, default=DEFAULT_TIMEOUT_LIST
+                ): cv.positive_int,
+                vol.Optional(
+                    TIMEOUT_STATS, default=DEFAULT_TIMEOUT_STATS
+                ): cv.positive_int,
+            }
+        ),
+        vol.Optional(CONF_CONCURRENCY, default=DEFAULT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_MEMORYCHANGE, default=100): cv.positive_int,
+        vol.Optional(CONF_DEADBAND, default={}): {
+            vol.In(CONTAINER_MONITOR_STATS_LIST): vol.Any(
+                vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Match(r"^\d+(\.\d+)?%$"),
+            )
+        },
+        vol.Optional(CONF_HEARTBEAT, default=DEFAULT_HEARTBEAT): cv.positive_int,
+        vol.Optional(CONF_STATS_STREAM, default=False): cv.boolean,
+        vol.Optional(CONF_INFO_BATCH, default=False): cv.boolean,
+        vol.Optional(
+            CONF_INFO_INTERVAL, default=DEFAULT_INFO_INTERVAL
+        ): cv.positive_int,
+        vol.Optional(CONF_CGROUP, default=False): cv.boolean,
+        vol.Optional(CONF_ADAPTIVE, default=False): cv.boolean,
+        vol.Optional(CONF_ADAPTIVE_MIN, default=0): cv.positive_int,
+        vol.Optional(CONF_ADAPTIVE_MAX, default=DEFAULT_ADAPTIVE_MAX): cv.positive_int,
+        vol.Optional(
+            CONF_ADAPTIVE_TOLERANCE, default=DEFAULT_ADAPTIVE_TOLERANCE
+        ): cv.positive_int,
+        vol.Optional(CONF_CGROUP_PATH, default=DEFAULT_CGROUP_PATH): cv.string,
+        vol.Optional(
+            CONF_INSPECT_INTERVAL, default=DEFAULT_INSPECT_INTERVAL
+        ): cv.positive_int,
         vol.Optional(CONF_PRECISION_CPU, default=PRECISION): cv.positive_int,
         vol.Optional(CONF_PRECISION_MEMORY_MB, default=PRECISION): cv.positive_int,
         vol.Optional(
@@ -106,6 +199,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass.data[DOMAIN][entry[CONF_NAME]][CONFIG] = entry
 
         startCount = 0
+        backoff = DockerBackoff(entry[CONF_RETRY])
 
         while True:
             doLoop = True
@@ -118,9 +212,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 if entry[CONF_RETRY] == 0:
                     raise
                 else:
+                    delay = backoff.failure()
                     _LOGGER.error("Failed Docker connect: %s", str(err))
-                    _LOGGER.error("Retry in %d seconds", entry[CONF_RETRY])
-                    await asyncio.sleep(entry[CONF_RETRY])
+                    _LOGGER.error("Retry in %d seconds", delay)
+                    await asyncio.sleep(delay)
 
             startCount += 1
 
@@ -111,9 +111,9 @@ async def async_setup_platform(
 
     buttons = []
 
-    # We support add/re-add of a container
+    # We support add/re-add of a batch of containers
     if CONTAINER in discovery_info:
-        clist = [discovery_info[CONTAINER]]
+        clist = discovery_info[CONTAINER]
     else:
         clist = api.list_containers()
 
@@ -186,6 +186,7 @@ class DockerContainerButton(ButtonEntity):
             slugify(self._prefix + "_" + self._cname + "_restart")
         )
         self._name = name_format.format(name=alias_name)
+        self._attr_available = True
         self._removed = False
 
     @property
@@ -254,6 +255,9 @@ class DockerContainerButton(ButtonEntity):
             if info is not None:
                 state = info.get(CONTAINER_INFO_STATE) == "running"
 
-        if state is not self._state:
+        available = self._container.is_available()
+
+        if state is not self._state or available != self._attr_available:
             self._state = state
+            self._attr_available = available
             self.async_schedule_update_ha_state()
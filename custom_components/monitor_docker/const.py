@@ -9,12 +9,25 @@ from homeassistant.const import PERCENTAGE, UnitOfDataRate, UnitOfInformation
 
 DOMAIN = "monitor_docker"
 API = "api"
+COALESCER = "coalescer"
 CONFIG = "config"
 CONTAINER = "container"
 
+CONF_ADAPTIVE = "adaptive"
+CONF_ADAPTIVE_MAX = "adaptive_max"
+CONF_ADAPTIVE_MIN = "adaptive_min"
+CONF_ADAPTIVE_TOLERANCE = "adaptive_tolerance"
 CONF_CERTPATH = "certpath"
+CONF_CGROUP = "cgroup"
+CONF_CGROUP_PATH = "cgroup_path"
+CONF_CONCURRENCY = "concurrency"
 CONF_CONTAINERS = "containers"
 CONF_CONTAINERS_EXCLUDE = "containers_exclude"
+CONF_DEADBAND = "deadband"
+CONF_HEARTBEAT = "heartbeat"
+CONF_INFO_BATCH = "info_batch"
+CONF_INFO_INTERVAL = "info_interval"
+CONF_INSPECT_INTERVAL = "inspect_interval"
 CONF_MEMORYCHANGE = "memorychange"
 CONF_PRECISION_CPU = "precision_cpu"
 CONF_PRECISION_MEMORY_MB = "precision_memory_mb"
@@ -24,25 +37,91 @@ CONF_PRECISION_NETWORK_MB = "precision_network_mb"
 CONF_PREFIX = "prefix"
 CONF_RENAME = "rename"
 CONF_RENAME_ENITITY = "rename_entity"
+CONF_RESUME = "resume"
 CONF_RETRY = "retry"
+CONF_SCAN_INTERVALS = "scan_intervals"
+CONF_STATS_STREAM = "stats_stream"
+CONF_TIMEOUTS = "timeouts"
 CONF_SENSORNAME = "sensorname"
 CONF_SWITCHENABLED = "switchenabled"
 CONF_SWITCHNAME = "switchname"
 CONF_BUTTONENABLED = "buttonenabled"
 CONF_BUTTONNAME = "buttonname"
 
+DEFAULT_ADAPTIVE_MAX = 300
+DEFAULT_ADAPTIVE_TOLERANCE = 10
+DEFAULT_CGROUP_PATH = "/sys/fs/cgroup"
+DEFAULT_CONCURRENCY = 10
+DEFAULT_HEARTBEAT = 600
+DEFAULT_INFO_INTERVAL = 600
+DEFAULT_INSPECT_INTERVAL = 300
 DEFAULT_NAME = "Docker"
 DEFAULT_RETRY = 60
+DEFAULT_TIMEOUT_ACTION = 60
+DEFAULT_TIMEOUT_INFO = 10
+DEFAULT_TIMEOUT_INSPECT = 10
+DEFAULT_TIMEOUT_LIST = 10
+DEFAULT_TIMEOUT_STATS = 10
 DEFAULT_SENSORNAME = "{name} {sensor}"
 DEFAULT_SWITCHNAME = "{name}"
 DEFAULT_BUTTONNAME = "{name} Restart"
 
 COMPONENTS = ["sensor", "switch", "button"]
 
+# Operations with their own timeout
+TIMEOUT_ACTION = "action"
+TIMEOUT_INFO = "info"
+TIMEOUT_INSPECT = "inspect"
+TIMEOUT_LIST = "list"
+TIMEOUT_STATS = "stats"
+
+# TCP connection pool: connections on top of the concurrency (events, info,
+# list, actions) and the keep-alive in seconds on top of the scan interval
+POOL_RESERVED = 5
+POOL_KEEPALIVE_MARGIN = 30
+
+# Seconds to wait on cancelled tasks and in-flight requests at shutdown
+SHUTDOWN_TIMEOUT = 5
+
+# Number of missed deadlines before the watchdog reports a collector as stalled
+WATCHDOG_MISSED = 3
+
+# Quiet period and maximum delay in seconds before queued create/destroy events are handled
+EVENT_QUIET_PERIOD = 1.0
+EVENT_MAX_DELAY = 10.0
+
+# Exponential backoff on errors, the circuit opens after a number of failures in a row
+BACKOFF_JITTER = 0.2
+BACKOFF_MAX = 600
+BREAKER_THRESHOLD = 3
+
+# Snapshot of the container counters in .storage, to continue after a restart
+SNAPSHOT_MAX_AGE = 600
+SNAPSHOT_SAVE_DELAY = 60
+SNAPSHOT_VERSION = 1
+
+# Container events which add, remove or rename a monitored container
+EVENT_ACTIONS_CONTAINER = ["create", "destroy", "rename"]
+
+# Container events which change the state/health of a container
+EVENT_ACTIONS_STATE = [
+    "start",
+    "die",
+    "stop",
+    "pause",
+    "unpause",
+    "restart",
+    "oom",
+    "health_status",
+]
+
 SERVICE_RESTART = "restart"
 
 PRECISION = 2
 
+# Docker API version which supports one-shot stats requests
+ONESHOT_API_VERSION = (1, 41)
+
 DOCKER_INFO_VERSION = "version"
 DOCKER_INFO_CONTAINER_RUNNING = "containers_running"
 DOCKER_INFO_CONTAINER_PAUSED = "containers_paused"
@@ -235,14 +314,31 @@ CONTAINER_MONITOR_NETWORK_LIST = [
     CONTAINER_STATS_NETWORK_TOTAL_DOWN,
 ]
 
+# Numeric container sensors, which support a deadband
+CONTAINER_MONITOR_STATS_LIST = [
+    CONTAINER_STATS_CPU_PERCENTAGE,
+    CONTAINER_STATS_1CPU_PERCENTAGE,
+    CONTAINER_STATS_MEMORY,
+    CONTAINER_STATS_MEMORY_PERCENTAGE,
+] + CONTAINER_MONITOR_NETWORK_LIST
+
 MONITORED_CONDITIONS_LIST = list(DOCKER_MONITOR_LIST.keys()) + list(
     CONTAINER_MONITOR_LIST.keys()
 )
 
+ATTR_CYCLE_DURATION = "Cycle_duration"
+ATTR_CYCLE_FAILED = "Cycle_failed"
+ATTR_CYCLE_OVERRUNS = "Cycle_overruns"
+ATTR_CYCLE_SKIPPED = "Cycle_skipped"
+ATTR_CYCLE_STALLED = "Cycle_stalled"
 ATTR_NAME = "name"
+ATTR_SAMPLE_EPOCH = "Sample_epoch"
+ATTR_SAMPLE_TIME = "Sample_time"
 ATTR_MEMORY_LIMIT = "Memory_limit"
 ATTR_ONLINE_CPUS = "Online_CPUs"
 ATTR_SERVER = "server"
+ATTR_STATE_WRITES = "State_writes"
+ATTR_STATE_WRITES_SKIPPED = "State_writes_skipped"
 ATTR_VERSION_ARCH = "Architecture"
 ATTR_VERSION_KERNEL = "Kernel"
 ATTR_VERSION_OS = "OS"
@@ -2,10 +2,15 @@
 
 import asyncio
 import concurrent
+import json
 import logging
+import math
 import os
+import random
+import re
 import ssl
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Callable
 
@@ -14,6 +19,7 @@ from aiohttp import ClientSession, ClientTimeout, TCPConnector
 import homeassistant.util.dt as dt_util
 from dateutil import parser, relativedelta
 from homeassistant.const import (
+    CONF_MONITORED_CONDITIONS,
     CONF_NAME,
     CONF_SCAN_INTERVAL,
     CONF_URL,
@@ -21,25 +27,53 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.discovery import load_platform
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import slugify
 
+from .cgroup import CgroupCollector
 from .const import (
+    ATTR_CYCLE_DURATION,
+    ATTR_CYCLE_FAILED,
+    ATTR_CYCLE_OVERRUNS,
+    ATTR_CYCLE_SKIPPED,
+    ATTR_CYCLE_STALLED,
     ATTR_MEMORY_LIMIT,
     ATTR_ONLINE_CPUS,
+    ATTR_SAMPLE_EPOCH,
+    ATTR_SAMPLE_TIME,
     ATTR_VERSION_ARCH,
     ATTR_VERSION_KERNEL,
     ATTR_VERSION_OS,
     ATTR_VERSION_OS_TYPE,
+    BACKOFF_JITTER,
+    BACKOFF_MAX,
+    BREAKER_THRESHOLD,
     COMPONENTS,
+    CONF_ADAPTIVE,
+    CONF_ADAPTIVE_MAX,
+    CONF_ADAPTIVE_MIN,
+    CONF_ADAPTIVE_TOLERANCE,
     CONF_CERTPATH,
+    CONF_CGROUP,
+    CONF_CGROUP_PATH,
+    CONF_CONCURRENCY,
+    CONF_INFO_BATCH,
+    CONF_INFO_INTERVAL,
+    CONF_INSPECT_INTERVAL,
     CONF_MEMORYCHANGE,
     CONF_PRECISION_CPU,
     CONF_PRECISION_MEMORY_MB,
     CONF_PRECISION_MEMORY_PERCENTAGE,
     CONF_PRECISION_NETWORK_KB,
     CONF_PRECISION_NETWORK_MB,
+    CONF_RESUME,
     CONF_RETRY,
+    CONF_SCAN_INTERVALS,
+    CONF_STATS_STREAM,
+    CONF_TIMEOUTS,
     CONTAINER,
+    CONTAINER_INFO_ALLINONE,
     CONTAINER_INFO_HEALTH,
     CONTAINER_INFO_IMAGE,
     CONTAINER_INFO_IMAGE_HASH,
@@ -66,13 +100,34 @@ from .const import (
     DOCKER_STATS_MEMORY,
     DOCKER_STATS_MEMORY_PERCENTAGE,
     DOMAIN,
+    EVENT_ACTIONS_CONTAINER,
+    EVENT_ACTIONS_STATE,
+    EVENT_MAX_DELAY,
+    EVENT_QUIET_PERIOD,
+    ONESHOT_API_VERSION,
+    POOL_KEEPALIVE_MARGIN,
+    POOL_RESERVED,
     PRECISION,
+    SHUTDOWN_TIMEOUT,
+    SNAPSHOT_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_VERSION,
+    TIMEOUT_ACTION,
+    TIMEOUT_INFO,
+    TIMEOUT_INSPECT,
+    TIMEOUT_LIST,
+    TIMEOUT_STATS,
+    WATCHDOG_MISSED,
 )
 
 VERSION = "1.20b3"
 
 _LOGGER = logging.getLogger(__name__)
 
+# SSL contexts per certificate path, shared by all Docker hosts and reconnects.
+# The mtimes of the certificate files are kept to detect a renewal.
+_SSL_CONTEXTS: dict[str, tuple[tuple[float, ...], ssl.SSLContext]] = {}
+
 
 def toKB(value: float, precision: int = PRECISION) -> float:
     """Converts bytes to kBytes."""
@@ -86,6 +141,32 @@ def toMB(value: float, precision: int = PRECISION) -> float:
     return round(value / (1024 ** 2), precision)
 
 
+def getScanInterval(config: ConfigType, cname: str) -> int:
+    """Get the scan interval of a container, the name or a regular expression
+    can overrule the scan interval of the Docker instance. The (compiled)
+    regular expression has to match the whole name."""
+    intervals: dict[re.Pattern, timedelta] = config[CONF_SCAN_INTERVALS]
+
+    for pattern, interval in intervals.items():
+        if pattern.pattern == cname:
+            return interval.seconds
+
+    for pattern, interval in intervals.items():
+        if pattern.fullmatch(cname):
+            return interval.seconds
+
+    return config[CONF_SCAN_INTERVAL].seconds
+
+
+def toApiVersion(value: str | None) -> tuple[int, int]:
+    """Converts a Docker API version string, e.g. 1.41, to a tuple."""
+    try:
+        major, minor = str(value).split(".")[:2]
+        return (int(major), int(minor))
+    except ValueError:
+        return (0, 0)
+
+
 #################################################################
 class DockerAPI:
     """Docker API abstraction allowing multiple Docker instances beeing monitored."""
@@ -99,11 +180,27 @@ class DockerAPI:
         self._containers: dict[str, DockerContainerAPI] = {}
         self._tasks: dict[str, asyncio.Task] = {}
         self._info: dict[str, Any] = {}
-        self._event_create: dict[str, int] = {}
-        self._event_destroy: dict[str, int] = {}
+        self._event_create: set[str] = set()
+        self._event_destroy: set[str] = set()
+        self._event_timer: asyncio.TimerHandle | None = None
+        self._event_first: float | None = None
         self._dockerStopped = False
+        self._available = False
+        self._resuming = False
         self._subscribers: list[Callable] = []
+        self._cycle_callbacks: list[Callable] = []
         self._api: aiodocker.Docker = None
+        self._stats_oneshot = False
+        self._cgroup: CgroupCollector | None = None
+        self._cgroup_job: asyncio.Future | None = None
+        self._total_cpu = 0.0
+        self._total_memory = 0.0
+        self._total_time: datetime | None = None
+        self._store = Store(
+            hass, SNAPSHOT_VERSION, f"{DOMAIN}.{slugify(self._instance)}"
+        )
+        self._store_pending = False
+        self._restored = False
 
         _LOGGER.debug("[%s]: Helper version: %s", self._instance, VERSION)
 
@@ -113,10 +210,41 @@ class DockerAPI:
             "[%s] CONF_SCAN_INTERVAL=%d, RETRY=%", self._interval, self._retry_interval
         )
 
+        # Stop polling all containers if the Docker host keeps failing
+        self._host_backoff = DockerBackoff(self._retry_interval)
+
+        # A container can be polled at another interval than the scan interval,
+        # with an overruled scan interval or with adaptive polling. Each of
+        # these intervals has to be a multiple of the scheduler tick.
+        intervals = [self._interval] + [
+            interval.seconds for interval in config[CONF_SCAN_INTERVALS].values()
+        ]
+        if config[CONF_ADAPTIVE]:
+            intervals += [config[CONF_ADAPTIVE_MIN], config[CONF_ADAPTIVE_MAX]]
+        tick = max(math.gcd(*intervals), 1)
+
+        # A poll is an inspect and a stats request, each with its own timeout
+        self._timeouts: dict[str, int] = config[CONF_TIMEOUTS]
+        self._poll_deadline = max(
+            tick, self._timeouts[TIMEOUT_INSPECT] + self._timeouts[TIMEOUT_STATS]
+        )
+
+        self._scheduler = DockerScheduler(
+            self._instance,
+            self._interval,
+            config[CONF_CONCURRENCY],
+            self._run_cycle_start,
+            self._run_cycle_end,
+            self._timeouts[TIMEOUT_INSPECT] + self._timeouts[TIMEOUT_STATS],
+            tick,
+        )
+
     async def init(self, startCount=0):
 
-        # Set to None when called twice, etc
-        self._api = None
+        # Called again on a reconnect, also after a reconnect which failed
+        # halfway. Stop the tasks and close the client of the previous call.
+        await self._cancel_tasks()
+        await self._close_api()
 
         try:
             # Try to fix unix:// to unix:/// (3 are required by aiodocker)
@@ -195,14 +323,25 @@ class DockerAPI:
                         self._docker_ssl_context
                     )
 
-                # Setup new TCP connection, otherwise timeout takes toooo long
-                connector = TCPConnector(ssl=ssl_context)
+                # Setup new TCP connection, otherwise timeout takes toooo long.
+                # The total time is limited per operation, see CONF_TIMEOUTS.
+                # Keep the connections alive between the poll cycles, thus
+                # no new TCP/TLS handshake per request. A stats stream keeps
+                # its connection open, so then the pool can't be limited.
+                limit = 0
+                if not self._config[CONF_STATS_STREAM]:
+                    limit = self._config[CONF_CONCURRENCY] + POOL_RESERVED
+
+                connector = TCPConnector(
+                    ssl=ssl_context,
+                    limit=limit,
+                    keepalive_timeout=self._interval + POOL_KEEPALIVE_MARGIN,
+                )
                 session = ClientSession(
                     connector=connector,
                     timeout=ClientTimeout(
                         connect=5,
                         sock_connect=5,
-                        total=10,
                     ),
                 )
 
@@ -211,6 +350,17 @@ class DockerAPI:
                 url=url, connector=connector, session=session, ssl_context=ssl_context
             )
 
+            # The cgroup files are only available on the local Docker host
+            if self._config[CONF_CGROUP]:
+                if url is None or url.find("unix:") == 0:
+                    self._cgroup = CgroupCollector(self._config[CONF_CGROUP_PATH])
+                else:
+                    _LOGGER.warning(
+                        "[%s]: Docker URL '%s' is not local, cgroup collector disabled",
+                        self._instance,
+                        url,
+                    )
+
         except Exception as err:
             exc_info = True if str(err) == "" else False
             _LOGGER.error(
@@ -221,11 +371,24 @@ class DockerAPI:
             )
             return
 
-        versionInfo = await self._api.version()
+        versionInfo = await asyncio.wait_for(
+            self._api.version(), self._timeouts[TIMEOUT_INFO]
+        )
         version: str | None = versionInfo.get("Version", None)
 
         # Pre 19.03 support memory calculation is dropped
         _LOGGER.debug("[%s]: Docker version: %s", self._instance, version)
+        self._info[DOCKER_INFO_VERSION] = version
+
+        # Newer Docker API versions can return stats without the (slow) pre-sample
+        apiVersion = versionInfo.get("ApiVersion", None)
+        self._stats_oneshot = toApiVersion(apiVersion) >= ONESHOT_API_VERSION
+        _LOGGER.debug(
+            "[%s]: Docker API version: %s, one-shot stats: %s",
+            self._instance,
+            apiVersion,
+            self._stats_oneshot,
+        )
 
         # Start task to monitor events of create/delete/start/stop
         self._tasks["events"] = asyncio.create_task(self._run_docker_events())
@@ -233,24 +396,86 @@ class DockerAPI:
         # Start task to monitor total/running containers
         self._tasks["info"] = asyncio.create_task(self._run_docker_info())
 
+        # Start task to detect stalled collectors
+        self._tasks["watchdog"] = asyncio.create_task(self._run_watchdog())
+
         # Get the list of containers to monitor
-        containers = await self._api.containers.list(all=True)
+        containers = await asyncio.wait_for(
+            self._api.containers.list(all=True), self._timeouts[TIMEOUT_LIST]
+        )
+
+        # Determine name from Docker API, it contains an array with a slash
+        listed: dict[str, str] = {
+            container.id: container._container["Names"][0][1:]
+            for container in containers or []
+        }
+
+        # After a reconnect, continue with the known containers with the same id
+        # and name. The others are gone or renamed during the outage.
+        resumed: set[str] = set()
+        if self._resuming:
+            for cname, known in list(self._containers.items()):
+                if listed.get(known.get_id()) == cname:
+                    resumed.add(cname)
+                else:
+                    await self._container_remove(cname)
+
+        added: list[str] = []
 
         for container in containers or []:
-            # Determine name from Docker API, it contains an array with a slash
-            cname: str = container._container["Names"][0][1:]
+            cname: str = listed[container.id]
+
+            if cname in resumed:
+                _LOGGER.debug("[%s] %s: Container resumed", self._instance, cname)
+                self._containers[cname].resume(self._api, container)
+                continue
 
             # We will monitor all containers, including excluded ones.
             # This is needed to get total CPU/Memory usage.
             _LOGGER.debug("[%s] %s: Container Monitored", self._instance, cname)
+            added.append(cname)
 
             # Create our Docker Container API
             self._containers[cname] = DockerContainerAPI(
                 self._config,
                 self._api,
                 cname,
+                oneshot=self._stats_oneshot,
+                aggregate=self._aggregate,
             )
-            await self._containers[cname].init()
+
+            # The container from the list has the id, thus no Docker request
+            if await self._containers[cname].init(container):
+                self._scheduler.add(self._containers[cname])
+
+        # Continue with the counters of the previous run, a resume still has them
+        if not self._resuming:
+            await self._snapshot_restore()
+
+        # First poll before the entities are created, then poll every interval
+        self._available = True
+        await self._run_cycle_start(list(self._containers.values()))
+        await self._scheduler.poll_now()
+        if not self._resuming:
+            # A resume keeps the last totals until its first cycle
+            self._run_cycle_end(0)
+        self._scheduler.start()
+
+        if self._resuming:
+            # The entities still exist, only create the ones of new containers
+            self._resuming = False
+            self._notify()
+
+            if added:
+                for component in COMPONENTS:
+                    load_platform(
+                        self._hass,
+                        component,
+                        DOMAIN,
+                        {CONF_NAME: self._instance, CONTAINER: added},
+                        self._config,
+                    )
+            return
 
         self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._monitor_stop)
 
@@ -266,14 +491,26 @@ class DockerAPI:
     #############################################################
     def _docker_ssl_context(self) -> ssl.SSLContext | None:
         """
-        Create a SSLContext object
+        Create a SSLContext object, or reuse the cached one if the
+        certificate files didn't change
         """
 
+        path2 = Path(self._config[CONF_CERTPATH])
+
+        mtimes = tuple(
+            (path2 / name).stat().st_mtime for name in ("ca.pem", "cert.pem", "key.pem")
+        )
+        cached = _SSL_CONTEXTS.get(str(path2))
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
+
+        _LOGGER.debug(
+            "[%s]: Loading certificates from '%s'", self._instance, str(path2)
+        )
+
         context = ssl.create_default_context(purpose=ssl.Purpose.SERVER_AUTH)
         context.set_ciphers(ssl._RESTRICTED_SERVER_CIPHERS)  # type: ignore
 
-        path2 = Path(self._config[CONF_CERTPATH])
-
         context.load_verify_locations(cafile=str(path2 / "ca.pem"))
         context.load_cert_chain(
             certfile=str(path2 / "cert.pem"), keyfile=str(path2 / "key.pem")
@@ -282,17 +519,92 @@ class DockerAPI:
         context.verify_flags &= ~ssl.VERIFY_X509_STRICT
         context.check_hostname = False
 
+        _SSL_CONTEXTS[str(path2)] = (mtimes, context)
+
         return context
 
     #############################################################
-    def _monitor_stop(self, _service_or_event: Event) -> None:
-        """Stop the monitor thread."""
+    async def _monitor_stop(self, _service_or_event: Event) -> None:
+        """Stop the monitor thread. First stop polling, then cancel all tasks,
+        wait a short time on the in-flight requests and close the client."""
 
         _LOGGER.info("[%s]: Stopping Monitor Docker thread", self._instance)
 
+        tasks = self._scheduler.stop()
+
+        if self._event_timer is not None:
+            self._event_timer.cancel()
+            self._event_timer = None
+
+        for container in self._containers.values():
+            task = container.cancel_task()
+            if task is not None:
+                tasks.append(task)
+
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+                tasks.append(task)
+        self._tasks = {}
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+            if pending:
+                _LOGGER.warning(
+                    "[%s]: %d task(s) did not stop in time",
+                    self._instance,
+                    len(pending),
+                )
+
+        await self._close_api()
+
+    #############################################################
+    async def _cancel_tasks(self) -> None:
+        """Cancel the tasks of a previous init and wait on them. Not the
+        calling task, the events task does the reconnect itself."""
+
+        current = asyncio.current_task()
+        tasks: list[asyncio.Task] = []
+
+        for name, task in list(self._tasks.items()):
+            if task is current:
+                continue
+
+            del self._tasks[name]
+            if not task.done():
+                task.cancel()
+                tasks.append(task)
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+            if pending:
+                _LOGGER.warning(
+                    "[%s]: %d task(s) did not stop in time",
+                    self._instance,
+                    len(pending),
+                )
+
+    #############################################################
+    async def _close_api(self) -> None:
+        """Close the aiodocker client and its session, stop polling first."""
+
+        self._scheduler.stop()
+
+        if self._api is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._api.close(), SHUTDOWN_TIMEOUT)
+        except Exception as err:
+            _LOGGER.debug("[%s]: Closing Docker client (%s)", self._instance, str(err))
+
+        self._api = None
+
     #############################################################
     async def _reconnectx(self):
 
+        backoff = DockerBackoff(self._retry_interval)
+
         while True:
             _LOGGER.debug("[%s] Reconnecting", self._instance)
 
@@ -300,13 +612,14 @@ class DockerAPI:
                 await self.init()
                 break
             except Exception as err:
+                delay = backoff.failure()
                 _LOGGER.error(
                     "[%s] Failed Docker connect (%s). Retry in %d seconds",
                     self._instance,
                     str(err),
-                    self._retry_interval,
+                    delay,
                 )
-                await asyncio.sleep(self._retry_interval)
+                await asyncio.sleep(delay)
 
         _LOGGER.debug("[%s] Reconnect success", self._instance)
 
@@ -323,7 +636,44 @@ class DockerAPI:
         for callback in self._subscribers:
             callback(remove=True)
 
-        self._subscriber: list[Callable] = []
+        self._subscribers = []
+
+    #############################################################
+    def _notify(self, diagnostics: bool = False) -> None:
+        """Notify the Docker info entities of new information or a changed
+        availability. With diagnostics, a change of only the diagnostic
+        counters is also written."""
+        for callback in self._subscribers:
+            callback(diagnostics=diagnostics)
+
+    #############################################################
+    def is_available(self) -> bool:
+        """Return if the connection with Docker is working."""
+        return self._available
+
+    #############################################################
+    def _suspend(self) -> None:
+        """Connection with Docker is lost, stop polling and mark all entities
+        unavailable. The containers are resumed after a reconnect."""
+
+        _LOGGER.info("[%s]: Entities unavailable until reconnected", self._instance)
+
+        self._available = False
+        self._resuming = True
+        self._scheduler.stop()
+
+        # Pending events are outdated, the reconnect compares the container list
+        if self._event_timer is not None:
+            self._event_timer.cancel()
+            self._event_timer = None
+        self._event_first = None
+        self._event_create = set()
+        self._event_destroy = set()
+
+        for container in self._containers.values():
+            container.suspend()
+
+        self._notify()
 
     #############################################################
     def register_callback(self, callback: Callable, variable: str) -> None:
@@ -337,7 +687,10 @@ class DockerAPI:
         """Function to retrieve docker events. We can add or remove monitored containers."""
 
         try:
-            subscriber = self._api.events.subscribe()
+            # Let the daemon filter the events, we only handle container events
+            subscriber = self._api.events.subscribe(
+                filters=json.dumps(self._event_filters())
+            )
 
             while True:
                 event: dict = await subscriber.get()
@@ -346,19 +699,11 @@ class DockerAPI:
                 if event is None:
                     _LOGGER.debug("[%s] run_docker_events RAW: None", self._instance)
                 else:
-                    # If Type=container, give some additional information
-                    addlog = ""
-                    if event["Type"] == "container":
-                        try:
-                            addlog = f", Name={event['Actor']['Attributes']['name']}"
-                        except:
-                            pass
-
                     _LOGGER.debug(
-                        "[%s] run_docker_events Type=%s%s, Action=%s",
+                        "[%s] run_docker_events Type=%s, Name=%s, Action=%s",
                         self._instance,
                         event["Type"],
-                        addlog,
+                        event.get("Actor", {}).get("Attributes", {}).get("name"),
                         event["Action"],
                     )
 
@@ -369,162 +714,47 @@ class DockerAPI:
                     # Set this to know if we stopped or HASS is stopping
                     self._dockerStopped = True
 
-                    # Remove the docker info sensors
-                    self.remove_entities()
-
-                    # Remove all the sensors/switches/buttons, they will be auto created if connection is working again
-                    for cname in list(self._containers.keys()):
-                        try:
-                            await self._container_remove(cname)
-                        except Exception as err:
-                            exc_info = True if str(err) == "" else False
-                            _LOGGER.error(
-                                "[%s]: Stopping gave an error %s",
-                                self._instance,
-                                str(err),
-                                exc_info=exc_info,
-                            )
-
-                    # Stop everything and return to the main thread
-                    self._monitor_stop(self._config[CONF_NAME])
-
-                    # TODO: improve reconnectx
-                    await self._reconnectx()
-
-                    break
-
-                # Only monitor container events
-                if event["Type"] == CONTAINER:
-                    if event["Action"] == "create":
-                        # Check if another task is running, ifso, we don't create a new one
-                        taskcreated = (
-                            True if self._event_create or self._event_destroy else False
-                        )
-
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Add container name to containers to be monitored this has to
-                        # be a new task, otherwise it will block our event monitoring
-                        if cname not in self._event_create:
-                            _LOGGER.debug(
-                                "[%s] %s: Event create container", self._instance, cname
-                            )
-                            self._event_create[cname] = 0
-                        else:
-                            _LOGGER.error(
-                                "[%s] %s: Event create container, but already in working table?",
-                                self._instance,
-                                cname,
-                            )
-
-                        if self._event_create and not taskcreated:
-                            await self._container_create_destroy()
-
-                    elif event["Action"] == "destroy":
-                        # Check if another task is running, ifso, we don't create a new one
-                        taskcreated = (
-                            True if self._event_create or self._event_destroy else False
-                        )
-
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Remove container name to containers to be monitored this has to
-                        # be a new task, otherwise it will block our event monitoring
-                        if cname in self._event_create:
-                            _LOGGER.warning(
-                                "[%s] %s: Event destroy received, but create wasn't executed yet",
-                                self._instance,
-                                cname,
-                            )
-                            del self._event_create[cname]
-                        elif cname not in self._event_destroy:
-                            _LOGGER.debug(
-                                "[%s] %s: Event destroy container",
-                                self._instance,
-                                cname,
-                            )
-                            self._event_destroy[cname] = 0
-                        else:
-                            _LOGGER.error(
-                                "%s: Event destroy container, but already in working table?",
-                                cname,
-                            )
-
-                        if self._event_destroy and not taskcreated:
-                            await self._container_create_destroy()
-                    elif event["Action"] == "rename":
-                        # during a docker-compose up -d <container> the old container can be renamed
-                        # sensors/switch/button should be removed before the new container is monitored
-
-                        # New name
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Old name, and remove leading slash
-                        oname = event["Actor"]["Attributes"]["oldName"]
-                        oname = oname[1:]
-
-                        if oname in self._containers:
-                            _LOGGER.debug(
-                                "[%s] %s: Event rename container to '%s'",
-                                self._instance,
-                                oname,
-                                cname,
-                            )
-
-                            # First remove the newly create container, has a temporary name
-                            if oname in self._event_create:
-                                _LOGGER.warning(
-                                    "[%s] %s: Event rename received, but create wasn't executed yet",
-                                    self._instance,
-                                    oname,
-                                )
-                                del self._event_create[cname]
-                            elif oname not in self._event_destroy:
-                                _LOGGER.debug(
-                                    "[%s] %s: Event rename (destroy) container",
-                                    self._instance,
-                                    oname,
-                                )
-                                self._event_destroy[oname] = 0
-                            else:
+                    if self._config[CONF_RESUME]:
+                        # Keep the entities, they are unavailable until reconnected
+                        self._suspend()
+                    else:
+                        # Stop polling, then remove the docker info sensors
+                        self._scheduler.stop()
+                        self.remove_entities()
+
+                        # Remove all the sensors/switches/buttons, they will be auto created if connection is working again
+                        for cname in list(self._containers.keys()):
+                            try:
+                                await self._container_remove(cname)
+                            except Exception as err:
+                                exc_info = True if str(err) == "" else False
                                 _LOGGER.error(
-                                    "%s: Event rename (destroy) container, but already in working table?",
-                                    oname,
+                                    "[%s]: Stopping gave an error %s",
+                                    self._instance,
+                                    str(err),
+                                    exc_info=exc_info,
                                 )
 
-                            # taskcreate is not unavailable, so remove for now
-                            if self._event_destroy:
-                                await self._container_create_destroy()
+                    # Close the broken connection, the reconnect creates a new client
+                    await self._close_api()
 
-                            # Second re-add the container with the original name
-                            taskcreated = (
-                                True
-                                if self._event_create or self._event_destroy
-                                else False
-                            )
+                    # TODO: improve reconnectx
+                    await self._reconnectx()
 
-                            if cname not in self._event_create:
-                                _LOGGER.debug(
-                                    "[%s] %s: Event rename (create) container",
-                                    self._instance,
-                                    cname,
-                                )
-                                self._event_create[cname] = 0
-                            else:
-                                _LOGGER.error(
-                                    "[%s] %s: Event rename (create) container, but already in working table?",
-                                    self._instance,
-                                    cname,
-                                )
+                    break
 
-                            if self._event_create and not taskcreated:
-                                await self._container_create_destroy()
-                        else:
-                            _LOGGER.error(
-                                "[%s] %s: Event rename container doesn't exist in list?",
-                                self._instance,
-                                oname,
-                            )
+                # A bad event or entity update shouldn't stop the event loop
+                try:
+                    self._handle_event(event)
+                except Exception as err:
+                    exc_info = True if str(err) == "" else False
+                    _LOGGER.error(
+                        "[%s]: run_docker_events cannot handle event %s (%s)",
+                        self._instance,
+                        event.get("Action"),
+                        str(err),
+                        exc_info=exc_info,
+                    )
 
         except Exception as err:
             exc_info = True if str(err) == "" else False
@@ -535,29 +765,179 @@ class DockerAPI:
                 exc_info=exc_info,
             )
 
+    #############################################################
+    def _handle_event(self, event: dict[str, Any]) -> None:
+        """Handle 1 Docker event."""
+
+        # Only monitor container events
+        if event["Type"] == CONTAINER:
+            if event["Action"] == "create":
+                cname = event["Actor"]["Attributes"]["name"]
+                _LOGGER.debug("[%s] %s: Event create container", self._instance, cname)
+                self._event_create.add(cname)
+                self._queue_event()
+
+            elif event["Action"] == "destroy":
+                cname = event["Actor"]["Attributes"]["name"]
+
+                if cname in self._event_create and cname not in self._containers:
+                    _LOGGER.warning(
+                        "[%s] %s: Event destroy received, but create wasn't executed yet",
+                        self._instance,
+                        cname,
+                    )
+                    self._event_create.discard(cname)
+                else:
+                    _LOGGER.debug(
+                        "[%s] %s: Event destroy container",
+                        self._instance,
+                        cname,
+                    )
+                    self._event_create.discard(cname)
+                    self._event_destroy.add(cname)
+                    self._queue_event()
+
+            elif event["Action"] == "rename":
+                # during a docker-compose up -d <container> the old container can be renamed
+                # sensors/switch/button should be removed before the new container is monitored
+
+                # New name
+                cname = event["Actor"]["Attributes"]["name"]
+
+                # Old name, and remove leading slash
+                oname = event["Actor"]["Attributes"]["oldName"]
+                oname = oname[1:]
+
+                if oname in self._containers or oname in self._event_create:
+                    _LOGGER.debug(
+                        "[%s] %s: Event rename container to '%s'",
+                        self._instance,
+                        oname,
+                        cname,
+                    )
+
+                    # First remove the old name, it can have a temporary name
+                    if oname in self._containers:
+                        self._event_destroy.add(oname)
+                    self._event_create.discard(oname)
+
+                    # Second re-add the container with the new name
+                    self._event_create.add(cname)
+                    self._queue_event()
+                else:
+                    _LOGGER.error(
+                        "[%s] %s: Event rename container doesn't exist in list?",
+                        self._instance,
+                        oname,
+                    )
+            elif event["Action"].split(":")[0] in EVENT_ACTIONS_STATE:
+                # Health has the format "health_status: healthy"
+                cname = event["Actor"]["Attributes"]["name"]
+
+                if cname in self._containers:
+                    self._containers[cname].event_update(event)
+
+    #############################################################
+    def _event_filters(self) -> dict[str, list[str]]:
+        """Docker event filters, only the container events we actually handle."""
+
+        actions = list(EVENT_ACTIONS_CONTAINER)
+
+        # The health event is only needed if the health is monitored, Docker
+        # matches "health_status" against e.g. "health_status: healthy"
+        conditions = self._config[CONF_MONITORED_CONDITIONS]
+        for action in EVENT_ACTIONS_STATE:
+            if (
+                action == "health_status"
+                and CONTAINER_INFO_HEALTH not in conditions
+                and CONTAINER_INFO_ALLINONE not in conditions
+            ):
+                continue
+            actions.append(action)
+
+        return {"type": [CONTAINER], "event": actions}
+
+    #############################################################
+    def _queue_event(self) -> None:
+        """(Re)start the quiet period of the create/destroy queue. The events
+        are handled after a quiet period, but never later than the max delay."""
+
+        loop = asyncio.get_running_loop()
+
+        if self._event_first is None:
+            self._event_first = loop.time()
+
+        if self._event_timer is not None:
+            self._event_timer.cancel()
+
+        delay = min(
+            EVENT_QUIET_PERIOD, self._event_first + EVENT_MAX_DELAY - loop.time()
+        )
+        self._event_timer = loop.call_later(max(delay, 0), self._run_event_queue)
+
+    #############################################################
+    def _run_event_queue(self) -> None:
+        """Start handling the queued events, without blocking the events loop."""
+
+        self._event_timer = None
+
+        # Previous batch still busy, try again after another quiet period. Not
+        # sooner, also not when the max delay has passed already
+        task = self._tasks.get("queue")
+        if task is not None and not task.done():
+            self._event_timer = asyncio.get_running_loop().call_later(
+                EVENT_QUIET_PERIOD, self._run_event_queue
+            )
+            return
+
+        self._event_first = None
+        self._tasks["queue"] = asyncio.create_task(self._container_create_destroy())
+
     #############################################################
     async def _container_create_destroy(self) -> None:
-        """Handles create or destroy of container events."""
+        """Handles create or destroy of container events in parallel batches."""
+
+        destroy, self._event_destroy = list(self._event_destroy), set()
+        create, self._event_create = list(self._event_create), set()
+
+        _LOGGER.debug(
+            "[%s]: Handling %d destroy and %d create event(s)",
+            self._instance,
+            len(destroy),
+            len(create),
+        )
 
         try:
-            while self._event_create or self._event_destroy:
-                # Go through create loop first
-                for cname in self._event_create:
-                    if self._event_create[cname] > 2:
-                        del self._event_create[cname]
-                        await self._container_add(cname)
-                        break
-                    else:
-                        self._event_create[cname] += 1
-                else:
-                    # If all create, we can handle the destroy loop
-                    for cname in self._event_destroy:
-                        await self._container_remove(cname)
+            # Destroy first, a recreated container can have the same name. An
+            # error of 1 container shouldn't stop the rest of the batch
+            results = await asyncio.gather(
+                *[self._container_remove(cname) for cname in destroy],
+                return_exceptions=True,
+            )
+            self._log_batch_errors("remove", destroy, results)
+
+            results = await asyncio.gather(
+                *[self._container_add(cname) for cname in create],
+                return_exceptions=True,
+            )
+            self._log_batch_errors("add", create, results)
+            added = [cname for cname, result in zip(create, results) if result is True]
 
-                    self._event_destroy = {}
+            if added:
+                # First poll before we create sensors/switches/buttons
+                await self._scheduler.poll_now(
+                    [self._containers[cname] for cname in added]
+                )
 
-                # Sleep for 1 second, don't try to create it too fast
-                await asyncio.sleep(1)
+                # Create the entities of the whole batch at once
+                for component in COMPONENTS:
+                    load_platform(
+                        self._hass,
+                        component,
+                        DOMAIN,
+                        {CONF_NAME: self._instance, CONTAINER: added},
+                        self._config,
+                    )
 
         except Exception as err:
             exc_info = True if str(err) == "" else False
@@ -569,43 +949,60 @@ class DockerAPI:
             )
 
     #############################################################
-    async def _container_add(self, cname: str) -> None:
+    def _log_batch_errors(self, action: str, cnames: list[str], results: list) -> None:
+        """Log the exceptions of a gathered batch of containers."""
+
+        for cname, result in zip(cnames, results):
+            if isinstance(result, Exception):
+                exc_info = result if str(result) == "" else False
+                _LOGGER.error(
+                    "[%s] %s: Cannot %s container (%s)",
+                    self._instance,
+                    cname,
+                    action,
+                    str(result),
+                    exc_info=exc_info,
+                )
+
+    #############################################################
+    async def _container_add(self, cname: str) -> bool:
+        """Start monitoring a container, the caller creates the entities."""
+
         if cname in self._containers:
             _LOGGER.error("[%s] %s: Container already monitored", self._instance, cname)
-            return
+            return False
 
         _LOGGER.debug("[%s] %s: Starting Container Monitor", self._instance, cname)
 
         # Create our Docker Container API
         self._containers[cname] = DockerContainerAPI(
-            self._config, self._api, cname, atInit=False
+            self._config,
+            self._api,
+            cname,
+            atInit=False,
+            oneshot=self._stats_oneshot,
+            aggregate=self._aggregate,
         )
 
         # We should wait until container is attached
         result = await self._containers[cname]._initGetContainer()
 
         if result:
-            # Lets wait 1 second before we try to create sensors/switches/buttons
-            await asyncio.sleep(1)
-
-            for component in COMPONENTS:
-                load_platform(
-                    self._hass,
-                    component,
-                    DOMAIN,
-                    {CONF_NAME: self._instance, CONTAINER: cname},
-                    self._config,
-                )
+            self._scheduler.add(self._containers[cname])
         else:
             _LOGGER.error(
                 "[%s] %s: Problem during start of monitoring", self._instance, cname
             )
 
+        return result
+
     #############################################################
     async def _container_remove(self, cname: str) -> None:
         if cname in self._containers:
             _LOGGER.debug("[%s] %s: Stopping Container Monitor", self._instance, cname)
+            self._scheduler.remove(cname)
             self._containers[cname].cancel_task()
+            self._containers[cname].clear_contribution()
             self._containers[cname].remove_entities()
             await asyncio.sleep(0.1)
             del self._containers[cname]
@@ -613,192 +1010,420 @@ class DockerAPI:
             _LOGGER.error("[%s] %s: Container is NOT monitored", self._instance, cname)
 
     #############################################################
-    async def _run_docker_info(self) -> None:
-        """Function to retrieve information like docker info."""
+    async def _run_cycle_start(self, containers: list["DockerContainerAPI"]) -> bool:
+        """Gather information of the due containers at once, before they are
+        polled. Returns False to skip the polls, when the Docker host is sick."""
+
+        # Don't hammer a sick Docker host with a failing request per container,
+        # only probe it with a ping after the backoff delay
+        if self._host_backoff.is_open():
+            if not self._host_backoff.allow():
+                return False
+
+            if not await self._ping():
+                delay = self._host_backoff.failure()
+                _LOGGER.debug(
+                    "[%s]: Docker ping failed, next probe in %d seconds",
+                    self._instance,
+                    delay,
+                )
+                return False
 
-        loopInit = False
-        self._dockerStopped = False
+            self._host_backoff.success()
+            _LOGGER.info("[%s]: Docker responds again, polling resumed", self._instance)
 
-        while True:
+        # 1 list call is only cheaper than an inspect per container for more
+        # than 1 container, e.g. not for a container with a short interval
+        if self._config[CONF_INFO_BATCH] and len(containers) > 1:
+            await self._run_container_list(containers)
 
-            error = True
+        if self._cgroup is not None:
+            await self._run_cgroup_stats(containers)
 
-            try:
-                if self._dockerStopped:
-                    _LOGGER.debug("[%s]: Stopping docker info thread", self._instance)
-                    break
+        return True
 
-                info = await self._api.system.info()
-                self._info[DOCKER_INFO_VERSION] = info.get("ServerVersion")
-                self._info[DOCKER_INFO_CONTAINER_RUNNING] = info.get(
-                    "ContainersRunning"
-                )
-                self._info[DOCKER_INFO_CONTAINER_PAUSED] = info.get("ContainersPaused")
-                self._info[DOCKER_INFO_CONTAINER_STOPPED] = info.get(
-                    "ContainersStopped"
-                )
-                self._info[DOCKER_INFO_CONTAINER_TOTAL] = info.get("Containers")
-                self._info[DOCKER_INFO_IMAGES] = info.get("Images")
-
-                self._info[ATTR_MEMORY_LIMIT] = info.get("MemTotal")
-                self._info[ATTR_ONLINE_CPUS] = info.get("NCPU")
-                self._info[ATTR_VERSION_OS] = info.get("OperatingSystem")
-                self._info[ATTR_VERSION_OS_TYPE] = info.get("OSType")
-                self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
-                self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
-
-                self._info[DOCKER_STATS_CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_1CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_MEMORY] = 0
-                self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = 0.0
-
-                # Now go through all containers and get the cpu/memory stats
-                for container in self._containers.values():
-                    try:
-                        info = container.get_info()
-                        if info.get(CONTAINER_INFO_STATE) == "running":
-                            stats = container.get_stats()
-                            if stats.get(CONTAINER_STATS_CPU_PERCENTAGE) is not None:
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE] += stats.get(
-                                    CONTAINER_STATS_CPU_PERCENTAGE
-                                )
-                            if stats.get(CONTAINER_STATS_MEMORY) is not None:
-                                self._info[DOCKER_STATS_MEMORY] += stats.get(
-                                    CONTAINER_STATS_MEMORY
-                                )
-                    except Exception as err:
-                        exc_info = True if str(err) == "" else False
-                        _LOGGER.error(
-                            "[%s]: run_docker_info memory/cpu of X (%s)",
-                            self._instance,
-                            str(err),
-                            exc_info=exc_info,
-                        )
+    #############################################################
+    async def _ping(self) -> bool:
+        """Cheap check if the Docker daemon responds."""
 
-                # Calculate memory percentage
-                if (
-                    self._info[ATTR_MEMORY_LIMIT] is not None
-                    and self._info[ATTR_MEMORY_LIMIT] != 0
-                ):
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_MEMORY]
-                        / toMB(self._info[ATTR_MEMORY_LIMIT], 4)
-                        * 100,
-                        self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                    )
+        async def ping() -> bool:
+            async with self._api._query("_ping") as response:
+                return response.status == 200
 
-                # Try to fix possible 0 values in history at start-up
-                if loopInit:
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                        self._config[CONF_PRECISION_CPU],
-                    )
+        try:
+            return await asyncio.wait_for(ping(), self._timeouts[TIMEOUT_INFO])
+        except Exception as err:
+            _LOGGER.debug("[%s]: Docker ping (%s)", self._instance, str(err))
+            return False
 
-                    # Calculate for 0-100%
-                    if self._info[DOCKER_STATS_CPU_PERCENTAGE] is None:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    else:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
-                            (
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE]
-                                / self._info[ATTR_ONLINE_CPUS]
-                            ),
-                            self._config[CONF_PRECISION_CPU],
-                        )
+    #############################################################
+    async def _run_watchdog(self) -> None:
+        """Report collectors which missed several deadlines, e.g. hanging on
+        a Docker call. A stalled poll cycle is restarted, otherwise it blocks
+        all polls forever. The scheduler is also restarted if its loop ended."""
 
-                    self._info[DOCKER_STATS_MEMORY] = round(
-                        self._info[DOCKER_STATS_MEMORY],
-                        self._config[CONF_PRECISION_MEMORY_MB],
-                    )
+        deadline = WATCHDOG_MISSED * self._poll_deadline
 
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                        self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                    )
-                else:
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE] = (
-                        None
-                        if self._info[DOCKER_STATS_CPU_PERCENTAGE] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                            self._config[CONF_PRECISION_CPU],
-                        )
-                    )
+        while True:
+            await asyncio.sleep(self._poll_deadline)
 
-                    # Calculate for 0-100%
-                    if self._info[DOCKER_STATS_CPU_PERCENTAGE] == 0.0:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    elif self._info[DOCKER_STATS_CPU_PERCENTAGE] is None:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    else:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
-                            (
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE]
-                                / self._info[ATTR_ONLINE_CPUS]
-                            ),
-                            self._config[CONF_PRECISION_CPU],
-                        )
+            if self._scheduler.restart_stalled(deadline):
+                _LOGGER.warning(
+                    "[%s]: Poll cycle stalled for more than %d seconds, restarted",
+                    self._instance,
+                    deadline,
+                )
 
-                    self._info[DOCKER_STATS_MEMORY] = (
-                        None
-                        if self._info[DOCKER_STATS_MEMORY] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_MEMORY],
-                            self._config[CONF_PRECISION_MEMORY_MB],
-                        )
-                    )
+            for container in list(self._containers.values()):
+                container.check_stream(deadline)
 
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = (
-                        None
-                        if self._info[DOCKER_STATS_MEMORY_PERCENTAGE] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                            self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                        )
+            if self._dockerStopped:
+                continue
+
+            for name in ("events", "info"):
+                task = self._tasks.get(name)
+                if task is not None and task.done():
+                    _LOGGER.warning(
+                        "[%s]: Task '%s' stopped unexpectedly", self._instance, name
                     )
+                    del self._tasks[name]
 
-                _LOGGER.debug(
-                    "[%s]: Version: %s, Containers: %s, Running: %s, CPU: %s%%, 1CPU: %s%%, Memory: %sMB, %s%%",
+            if self._scheduler.restart():
+                _LOGGER.warning(
+                    "[%s]: Task 'scheduler' stopped unexpectedly, restarted",
                     self._instance,
-                    self._info[DOCKER_INFO_VERSION],
-                    self._info[DOCKER_INFO_CONTAINER_TOTAL],
-                    self._info[DOCKER_INFO_CONTAINER_RUNNING],
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                    self._info[DOCKER_STATS_1CPU_PERCENTAGE],
-                    self._info[DOCKER_STATS_MEMORY],
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
                 )
 
-                loopInit = True
-                error = False
+    #############################################################
+    def _check_host(self) -> None:
+        """Open the host circuit breaker if all polls of a cycle failed."""
 
-            except asyncio.TimeoutError as err:
-                _LOGGER.error(
-                    "[%s]: run_docker_info (%s) TCP Timeout. Retry in %d seconds",
-                    self._instance,
-                    self._retry_interval,
-                )
-            except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s]: run_docker_info (%s). Retry in %d seconds",
-                    self._instance,
-                    str(err),
-                    self._retry_interval,
-                    exc_info=exc_info,
-                )
+        polled, failed = self._scheduler.get_cycle_result()
 
-            if error:
-                await asyncio.sleep(self._retry_interval)
-            else:
-                await asyncio.sleep(self._interval)
+        if polled == 0:
+            return
+
+        if failed < polled:
+            self._host_backoff.success()
+            return
+
+        delay = self._host_backoff.failure()
+        if self._host_backoff.failures == BREAKER_THRESHOLD:
+            _LOGGER.warning(
+                "[%s]: All %d container polls failed %d times, pausing polls and probing Docker every %d seconds or more",
+                self._instance,
+                polled,
+                BREAKER_THRESHOLD,
+                delay,
+            )
 
     #############################################################
-    def list_containers(self):
-        return self._containers.keys()
+    def _aggregate(self, old: tuple[float, float], new: tuple[float, float]) -> None:
+        """Update the running CPU/memory totals with the change of 1 container."""
+        self._total_cpu += new[0] - old[0]
+        self._total_memory += new[1] - old[1]
+        self._total_time = dt_util.utcnow()
 
     #############################################################
-    def get_container(self, cname: str) -> "DockerContainerAPI":
+    def _run_cycle_end(self, epoch: int) -> None:
+        """Publish the running CPU/memory totals as 1 snapshot, thus the host
+        sensors always show the values of the same poll cycle."""
+
+        if epoch > 0:
+            self._check_host()
+
+        cpu = round(max(self._total_cpu, 0.0), self._config[CONF_PRECISION_CPU])
+        memory = round(
+            max(self._total_memory, 0.0), self._config[CONF_PRECISION_MEMORY_MB]
+        )
+
+        # Calculate for 0-100%
+        cpu1 = None
+        if self._info.get(ATTR_ONLINE_CPUS):
+            cpu1 = round(
+                cpu / self._info[ATTR_ONLINE_CPUS], self._config[CONF_PRECISION_CPU]
+            )
+
+        # Calculate memory percentage
+        memoryPercentage = None
+        if self._info.get(ATTR_MEMORY_LIMIT):
+            memoryPercentage = round(
+                memory / toMB(self._info[ATTR_MEMORY_LIMIT], 4) * 100,
+                self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
+            )
+
+        # Try to fix possible 0 values in history at start-up, the first
+        # sample of a container has no CPU usage without a restored snapshot
+        if epoch == 0 and not self._restored:
+            cpu = None if cpu == 0.0 else cpu
+            cpu1 = None if cpu is None else cpu1
+            memory = None if memory == 0.0 else memory
+            memoryPercentage = None if memory is None else memoryPercentage
+
+        self._info.update(
+            {
+                DOCKER_STATS_CPU_PERCENTAGE: cpu,
+                DOCKER_STATS_1CPU_PERCENTAGE: cpu1,
+                DOCKER_STATS_MEMORY: memory,
+                DOCKER_STATS_MEMORY_PERCENTAGE: memoryPercentage,
+                ATTR_SAMPLE_EPOCH: epoch,
+                ATTR_SAMPLE_TIME: (
+                    self._total_time.isoformat() if self._total_time else None
+                ),
+            }
+        )
+
+        self._snapshot_save()
+
+        # Push the new totals, the cycle callbacks write them
+        self._notify()
+
+        for callback in self._cycle_callbacks:
+            callback()
+
+    #############################################################
+    def register_cycle_callback(self, callback: Callable) -> None:
+        """Register callback, called at the end of each poll cycle."""
+        if callback not in self._cycle_callbacks:
+            self._cycle_callbacks.append(callback)
+
+    #############################################################
+    def in_cycle(self) -> bool:
+        """Return if the containers of a poll cycle are being polled."""
+        return self._scheduler.in_cycle()
+
+    #############################################################
+    async def _snapshot_restore(self) -> None:
+        """Restore the counters of the previous run, keyed by container id."""
+
+        try:
+            data = await self._store.async_load()
+        except Exception as err:
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s]: Cannot load snapshot (%s)",
+                self._instance,
+                str(err),
+                exc_info=exc_info,
+            )
+            return
+
+        if not data:
+            return
+
+        now = dt_util.utcnow()
+
+        for container in self._containers.values():
+            snapshot = data.get(container.get_id())
+            if snapshot and container.restore_snapshot(snapshot, now):
+                self._restored = True
+
+    #############################################################
+    def _snapshot_save(self) -> None:
+        """Schedule a save of the counters, the store writes it delayed and
+        also when Home Assistant stops."""
+
+        if not self._store_pending:
+            self._store_pending = True
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    #############################################################
+    def _snapshot(self) -> dict[str, Any]:
+        """Snapshot of the counters of all containers, keyed by container id."""
+
+        self._store_pending = False
+
+        data: dict[str, Any] = {}
+        for container in self._containers.values():
+            cid = container.get_id()
+            snapshot = container.get_snapshot()
+            if cid is not None and snapshot is not None:
+                data[cid] = snapshot
+
+        return data
+
+    #############################################################
+    async def _run_cgroup_stats(self, due: list["DockerContainerAPI"]) -> None:
+        """Read the stats of the due containers from the cgroup files in 1 pass."""
+
+        containers = {
+            container.get_id(): container
+            for container in due
+            if container.get_id() is not None
+        }
+
+        # A hanging read of /sys or /proc can't be cancelled, but it shouldn't
+        # block the poll cycle. The cgroup files are skipped until it is done.
+        result: dict[str, dict[str, Any]] = {}
+        if self._cgroup_job is not None and not self._cgroup_job.done():
+            _LOGGER.debug("[%s]: Previous cgroup read still busy", self._instance)
+        else:
+            self._cgroup_job = self._hass.async_add_executor_job(
+                self._cgroup.collect, list(containers)
+            )
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.shield(self._cgroup_job), self._timeouts[TIMEOUT_STATS]
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "[%s]: Reading the cgroup files took more than %d seconds",
+                    self._instance,
+                    self._timeouts[TIMEOUT_STATS],
+                )
+            except Exception as err:
+                exc_info = True if str(err) == "" else False
+                _LOGGER.error(
+                    "[%s]: run_cgroup_stats (%s)",
+                    self._instance,
+                    str(err),
+                    exc_info=exc_info,
+                )
+
+        # Without cgroup information, a container falls back to the Docker API
+        for cid, container in containers.items():
+            container.set_cgroup_stats(result.get(cid))
+
+    #############################################################
+    async def _run_container_list(self, due: list["DockerContainerAPI"]) -> None:
+        """Get the state/status/image of the due containers with 1 list call,
+        the containers only do a full inspect on a change."""
+
+        listed: dict[str, dict] = {}
+
+        try:
+            containers = await asyncio.wait_for(
+                self._api.containers.list(all=True), self._timeouts[TIMEOUT_LIST]
+            )
+
+            for container in containers or []:
+                listed[container._container["Names"][0][1:]] = container._container
+
+        except Exception as err:
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s]: run_container_list (%s)",
+                self._instance,
+                str(err),
+                exc_info=exc_info,
+            )
+
+        # Without list information, a container does a full inspect
+        for container in due:
+            container.set_list_info(listed.get(container.get_name()))
+
+    #############################################################
+    async def _run_docker_info(self) -> None:
+        """Function to retrieve information like docker info."""
+
+        self._dockerStopped = False
+        infoTime: float | None = None
+        backoff = DockerBackoff(self._retry_interval)
+
+        while True:
+
+            error = True
+
+            try:
+                if self._dockerStopped:
+                    _LOGGER.debug("[%s]: Stopping docker info thread", self._instance)
+                    break
+
+                # The docker info is expensive and almost never changes
+                if (
+                    infoTime is None
+                    or time.monotonic() - infoTime >= self._config[CONF_INFO_INTERVAL]
+                ):
+                    info = await asyncio.wait_for(
+                        self._api.system.info(), self._timeouts[TIMEOUT_INFO]
+                    )
+                    self._info[DOCKER_INFO_VERSION] = info.get("ServerVersion")
+                    self._info[DOCKER_INFO_IMAGES] = info.get("Images")
+
+                    self._info[ATTR_MEMORY_LIMIT] = info.get("MemTotal")
+                    self._info[ATTR_ONLINE_CPUS] = info.get("NCPU")
+                    self._info[ATTR_VERSION_OS] = info.get("OperatingSystem")
+                    self._info[ATTR_VERSION_OS_TYPE] = info.get("OSType")
+                    self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
+                    self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
+
+                    infoTime = time.monotonic()
+
+                # Container counts from our own container table, kept current by events
+                self._info.update(self._container_counts())
+
+                # Scheduler counters, useful to size the scan interval
+                self._info.update(self._scheduler.get_counters())
+
+                _LOGGER.debug(
+                    "[%s]: Version: %s, Containers: %s, Running: %s, CPU: %s%%, 1CPU: %s%%, Memory: %sMB, %s%%",
+                    self._instance,
+                    self._info[DOCKER_INFO_VERSION],
+                    self._info[DOCKER_INFO_CONTAINER_TOTAL],
+                    self._info[DOCKER_INFO_CONTAINER_RUNNING],
+                    self._info.get(DOCKER_STATS_CPU_PERCENTAGE),
+                    self._info.get(DOCKER_STATS_1CPU_PERCENTAGE),
+                    self._info.get(DOCKER_STATS_MEMORY),
+                    self._info.get(DOCKER_STATS_MEMORY_PERCENTAGE),
+                )
+
+                # Once per pass, the diagnostic counters change every cycle
+                self._notify(diagnostics=True)
+
+                error = False
+
+            except asyncio.TimeoutError as err:
+                _LOGGER.error(
+                    "[%s]: run_docker_info TCP Timeout",
+                    self._instance,
+                )
+            except Exception as err:
+                exc_info = True if str(err) == "" else False
+                _LOGGER.error(
+                    "[%s]: run_docker_info (%s)",
+                    self._instance,
+                    str(err),
+                    exc_info=exc_info,
+                )
+
+            if error:
+                delay = backoff.failure()
+                _LOGGER.debug(
+                    "[%s]: run_docker_info retry in %d seconds", self._instance, delay
+                )
+                await asyncio.sleep(delay)
+            else:
+                backoff.success()
+                await asyncio.sleep(self._interval)
+
+    #############################################################
+    def _container_counts(self) -> dict[str, int]:
+        """Count the running/paused/stopped containers."""
+
+        counts = {
+            DOCKER_INFO_CONTAINER_RUNNING: 0,
+            DOCKER_INFO_CONTAINER_PAUSED: 0,
+            DOCKER_INFO_CONTAINER_STOPPED: 0,
+            DOCKER_INFO_CONTAINER_TOTAL: len(self._containers),
+        }
+
+        for container in self._containers.values():
+            state = container.get_container_info().state
+            if state == "running":
+                counts[DOCKER_INFO_CONTAINER_RUNNING] += 1
+            elif state == "paused":
+                counts[DOCKER_INFO_CONTAINER_PAUSED] += 1
+            else:
+                counts[DOCKER_INFO_CONTAINER_STOPPED] += 1
+
+        return counts
+
+    #############################################################
+    def list_containers(self):
+        return self._containers.keys()
+
+    #############################################################
+    def get_container(self, cname: str) -> "DockerContainerAPI":
         if cname in self._containers:
             return self._containers[cname]
         else:
@@ -812,6 +1437,572 @@ class DockerAPI:
         return self._info
 
 
+#################################################################
+class DockerBackoff:
+    """Exponential backoff with jitter, which is also a circuit breaker. After
+    a number of failures in a row the circuit is open, and only 1 attempt
+    (probe) is allowed after each backoff delay."""
+
+    def __init__(
+        self,
+        base: float,
+        maximum: float = BACKOFF_MAX,
+        threshold: int = BREAKER_THRESHOLD,
+    ):
+        self._base = max(base, 1)
+        self._maximum = max(maximum, self._base)
+        self._threshold = threshold
+        self._failures = 0
+        self._retry_at = 0.0
+
+    #############################################################
+    @property
+    def failures(self) -> int:
+        """Return the number of failures in a row."""
+        return self._failures
+
+    #############################################################
+    def is_open(self) -> bool:
+        """Return if the circuit is open."""
+        return self._failures >= self._threshold
+
+    #############################################################
+    def allow(self) -> bool:
+        """Check if an attempt is allowed now."""
+        return not self.is_open() or time.monotonic() >= self._retry_at
+
+    #############################################################
+    def failure(self) -> float:
+        """Register a failure, returns the delay before the next attempt."""
+        self._failures += 1
+
+        delay = min(self._maximum, self._base * 2 ** min(self._failures - 1, 16))
+        delay *= random.uniform(1 - BACKOFF_JITTER, 1)
+
+        self._retry_at = time.monotonic() + delay
+        return delay
+
+    #############################################################
+    def success(self) -> bool:
+        """Register a success, returns if the circuit was open."""
+        wasOpen = self.is_open()
+        self._failures = 0
+        self._retry_at = 0.0
+        return wasOpen
+
+
+#################################################################
+class DockerScheduler:
+    """Scheduler which polls all containers of 1 Docker instance, instead of
+    every container running its own loop. The poll start times are spread
+    over the interval and the concurrency is bounded. A poll which doesn't
+    finish within the interval keeps running, the container is skipped
+    until it is done.
+
+    Containers with a shorter (overruled or adaptive) interval are polled on
+    the ticks in between, the interval is a multiple of the tick. The
+    pre-cycle only gets the due containers of a tick, the post-cycle for the
+    whole Docker host is only done once per interval."""
+
+    def __init__(
+        self,
+        instance: str,
+        interval: int,
+        concurrency: int,
+        pre_cycle: Callable | None = None,
+        post_cycle: Callable | None = None,
+        timeout: float | None = None,
+        tick: int | None = None,
+    ):
+        self._instance = instance
+        self._interval = interval
+        self._tick = tick or interval
+        self._ticks = max(round(interval / self._tick), 1)
+        self._timeout = timeout
+        self._pre_cycle = pre_cycle
+        self._post_cycle = post_cycle
+        self._cycles = 0
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._containers: dict[str, DockerContainerAPI] = {}
+        self._polls: dict[str, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+        self._cycle: float | None = None
+        self._cycle_duration: float | None = None
+        self._cycle_overruns = 0
+        self._cycle_skipped = 0
+        self._cycle_polled = 0
+        self._cycle_failed = 0
+        self._tick_polled = 0
+        self._tick_failed = 0
+        self._polls_failed = 0
+        self._cycle_stalled = 0
+        self._tick_start: float | None = None
+        self._in_cycle = False
+
+    #############################################################
+    def add(self, container: "DockerContainerAPI") -> None:
+        """Add container to the poll schedule, it is polled the next cycle."""
+        self._containers[container.get_name()] = container
+
+    #############################################################
+    def remove(self, cname: str) -> None:
+        """Remove container from the poll schedule, also cancel a running poll."""
+        self._containers.pop(cname, None)
+
+        task = self._polls.pop(cname, None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    #############################################################
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    #############################################################
+    def restart(self) -> bool:
+        """Restart the loop if it ended unexpectedly, but not after a stop.
+        Returns if it was restarted."""
+        if self._task is None or not self._task.done():
+            return False
+
+        self._in_cycle = False
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    #############################################################
+    def stop(self) -> list[asyncio.Task]:
+        """Stop polling and cancel the running polls, the schedule is kept.
+        Returns the cancelled tasks, to wait on them."""
+        cancelled: list[asyncio.Task] = []
+
+        if self._task is not None:
+            self._task.cancel()
+            cancelled.append(self._task)
+            self._task = None
+        self._in_cycle = False
+        self._tick_start = None
+
+        for task in self._polls.values():
+            if not task.done():
+                task.cancel()
+                cancelled.append(task)
+        self._polls = {}
+
+        return cancelled
+
+    #############################################################
+    async def poll_now(self, containers: list | None = None) -> None:
+        """Poll containers right away, e.g. before their entities are created.
+        A container with a poll in progress isn't polled twice, we wait on
+        the running poll instead."""
+        if containers is None:
+            containers = list(self._containers.values())
+
+        cycle = self._cycle
+        if cycle is None:
+            cycle = asyncio.get_running_loop().time()
+
+        tasks: dict[str, asyncio.Task] = {}
+        for container in containers:
+            cname = container.get_name()
+            task = self._polls.get(cname)
+            if task is None or task.done():
+                task = asyncio.create_task(self._poll(container, cycle, 0))
+                self._polls[cname] = task
+            tasks[cname] = task
+
+        if tasks:
+            await asyncio.wait(tasks.values())
+
+        for cname, task in tasks.items():
+            if self._polls.get(cname) is task:
+                del self._polls[cname]
+
+    #############################################################
+    def get_counters(self) -> dict[str, Any]:
+        """Return the cycle counters."""
+        return {
+            ATTR_CYCLE_DURATION: self._cycle_duration,
+            ATTR_CYCLE_OVERRUNS: self._cycle_overruns,
+            ATTR_CYCLE_SKIPPED: self._cycle_skipped,
+            ATTR_CYCLE_FAILED: self._polls_failed,
+            ATTR_CYCLE_STALLED: self._cycle_stalled,
+        }
+
+    #############################################################
+    def restart_stalled(self, deadline: float) -> bool:
+        """Restart the loop if it didn't start a tick within the deadline, e.g.
+        hanging in the pre-cycle. The polls are bounded by their timeout.
+        Returns if it was restarted."""
+
+        if self._task is None or self._task.done() or self._tick_start is None:
+            return False
+
+        if asyncio.get_running_loop().time() - self._tick_start <= deadline:
+            return False
+
+        self._task.cancel()
+        self._in_cycle = False
+        self._cycle_stalled += 1
+        self._tick_start = None
+        self._task = asyncio.create_task(self._run())
+        return True
+
+    #############################################################
+    def in_cycle(self) -> bool:
+        """Return if the containers of a cycle are being polled."""
+        return self._in_cycle
+
+    #############################################################
+    def get_cycle_result(self) -> tuple[int, int]:
+        """Return the number of polled and failed containers of the last cycle."""
+        return self._cycle_polled, self._cycle_failed
+
+    #############################################################
+    async def _run(self) -> None:
+        """Loop to poll all containers. Every tick the due containers are
+        polled, the pre/post-cycle work is only done once per interval."""
+
+        loop = asyncio.get_running_loop()
+        first = loop.time()
+        index = 0
+        start = first
+        cycle: dict[str, asyncio.Task] | None = None
+
+        while True:
+            self._tick_start = loop.time()
+            tick = first + index * self._tick
+            newCycle = index % self._ticks == 0
+            index += 1
+            nextTick = first + index * self._tick
+
+            # An error, e.g. of an entity callback, shouldn't stop the polling
+            try:
+                if newCycle:
+                    # The unfinished polls of the previous cycle keep running
+                    if cycle is not None:
+                        ended, cycle = cycle, None
+                        self._end_cycle(start, ended)
+
+                    start = loop.time()
+                    self._cycle = tick
+                    cycle = await self._start_polls(tick, self._interval)
+
+                    # A cycle skipped by the pre-cycle, e.g. the Docker host is sick
+                    if cycle is None:
+                        self._cycle_skipped += 1
+                    else:
+                        self._in_cycle = True
+                else:
+                    await self._start_polls(tick, self._tick)
+
+                # Wait on the polls of the cycle, but not longer than the next tick
+                if cycle is not None:
+                    pending: set[asyncio.Task] = set()
+                    if cycle:
+                        _, pending = await asyncio.wait(
+                            cycle.values(), timeout=max(nextTick - loop.time(), 0)
+                        )
+                    if not pending:
+                        ended, cycle = cycle, None
+                        self._end_cycle(start, ended)
+
+            except Exception as err:
+                exc_info = True if str(err) == "" else False
+                _LOGGER.error(
+                    "[%s]: Poll cycle (%s)",
+                    self._instance,
+                    str(err),
+                    exc_info=exc_info,
+                )
+
+            # Skip the ticks we missed, instead of queueing more work
+            now = loop.time()
+            if now >= nextTick + self._tick:
+                skipped = int((now - nextTick) // self._tick)
+                cycles = (index + skipped) // self._ticks - index // self._ticks
+                index += skipped
+                nextTick = first + index * self._tick
+                if cycles > 0:
+                    self._cycle_overruns += 1
+                    self._cycle_skipped += cycles
+                    _LOGGER.warning(
+                        "[%s]: Poll cycle took %.1f seconds, skipping %d cycle(s)",
+                        self._instance,
+                        now - start,
+                        cycles,
+                    )
+
+            await asyncio.sleep(max(nextTick - now, 0))
+
+    #############################################################
+    async def _start_polls(
+        self, tick: float, span: float
+    ) -> dict[str, asyncio.Task] | None:
+        """Start polling the due containers, spread over the first half of the
+        span. Returns None if the pre-cycle skipped the polls."""
+
+        self._collect()
+
+        # Skip the containers with a poll still in progress
+        containers = [
+            container
+            for cname, container in self._containers.items()
+            if cname not in self._polls and container.poll_due(tick)
+        ]
+        if not containers:
+            return {}
+
+        # The pre-cycle can skip the polls, e.g. when the Docker host is sick
+        if self._pre_cycle is not None:
+            if await self._pre_cycle(containers) is False:
+                return None
+
+        # The second half of the span is headroom to finish the polls in time
+        spread = span / 2 / len(containers)
+
+        tasks: dict[str, asyncio.Task] = {}
+        for index, container in enumerate(containers):
+            tasks[container.get_name()] = asyncio.create_task(
+                self._poll(container, tick, index * spread)
+            )
+        self._polls.update(tasks)
+
+        return tasks
+
+    #############################################################
+    def _collect(self) -> None:
+        """Count the finished polls, also the ones of earlier ticks."""
+
+        for cname, task in list(self._polls.items()):
+            if not task.done():
+                continue
+
+            del self._polls[cname]
+            self._tick_polled += 1
+            if task.cancelled() or task.exception() is not None:
+                continue
+            if task.result() is False:
+                self._tick_failed += 1
+
+    #############################################################
+    def _end_cycle(self, start: float, tasks: dict[str, asyncio.Task]) -> None:
+        """Finish a cycle, also when some of its polls are still running."""
+
+        self._in_cycle = False
+        self._collect()
+
+        self._cycle_polled, self._tick_polled = self._tick_polled, 0
+        self._cycle_failed, self._tick_failed = self._tick_failed, 0
+        self._polls_failed += self._cycle_failed
+
+        self._cycles += 1
+        if self._post_cycle is not None:
+            self._post_cycle(self._cycles)
+
+        self._cycle_duration = round(asyncio.get_running_loop().time() - start, 3)
+
+        pending = sum(1 for task in tasks.values() if not task.done())
+        if pending:
+            self._cycle_overruns += 1
+            _LOGGER.warning(
+                "[%s]: %d poll(s) not finished within the poll cycle",
+                self._instance,
+                pending,
+            )
+        else:
+            _LOGGER.debug(
+                "[%s]: Poll cycle of %d container(s) took %.3f seconds",
+                self._instance,
+                len(tasks),
+                self._cycle_duration,
+            )
+
+    #############################################################
+    async def _poll(
+        self, container: "DockerContainerAPI", cycle: float, delay: float
+    ) -> bool | None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        async with self._semaphore:
+            try:
+                return await asyncio.wait_for(container.poll(cycle), self._timeout)
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "[%s] %s: Poll took more than %d seconds, cancelled",
+                    self._instance,
+                    container.get_name(),
+                    self._timeout,
+                )
+                return False
+
+
+#################################################################
+class DockerCpuCounters:
+    """CPU counters of the previous stats sample, updated in place."""
+
+    __slots__ = ("read", "total", "system")
+
+    def __init__(self):
+        self.read: datetime | None = None
+        self.total: int = 0
+        self.system: int | None = None
+
+    def __bool__(self) -> bool:
+        return self.read is not None
+
+    #############################################################
+    def update(self, read: datetime, total: int, system: int | None) -> None:
+        """Store the counters of a new sample."""
+        self.read = read
+        self.total = total
+        self.system = system
+
+    #############################################################
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for the snapshot store."""
+        return {
+            "read": self.read.isoformat(),
+            "total": self.total,
+            "system": self.system,
+        }
+
+    #############################################################
+    def from_dict(self, data: dict[str, Any], read: datetime) -> None:
+        """Restore the counters from the snapshot store."""
+        self.update(read, data["total"], data["system"])
+
+
+#################################################################
+class DockerNetworkCounters:
+    """Network counters of the previous stats sample, updated in place."""
+
+    __slots__ = ("read", "total_tx", "total_rx")
+
+    def __init__(self):
+        self.read: datetime | None = None
+        self.total_tx: int = 0
+        self.total_rx: int = 0
+
+    def __bool__(self) -> bool:
+        return self.read is not None
+
+    #############################################################
+    def update(self, read: datetime, total_tx: int, total_rx: int) -> None:
+        """Store the counters of a new sample."""
+        self.read = read
+        self.total_tx = total_tx
+        self.total_rx = total_rx
+
+    #############################################################
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for the snapshot store."""
+        return {
+            "read": self.read.isoformat(),
+            "total_tx": self.total_tx,
+            "total_rx": self.total_rx,
+        }
+
+    #############################################################
+    def from_dict(self, data: dict[str, Any], read: datetime) -> None:
+        """Restore the counters from the snapshot store."""
+        self.update(read, data["total_tx"], data["total_rx"])
+
+
+#################################################################
+class DockerContainerInfo:
+    """Container information of the last inspect, updated in place."""
+
+    __slots__ = (
+        "state",
+        "image",
+        "image_hash",
+        "health",
+        "status",
+        "uptime",
+        "network_available",
+    )
+
+    def __init__(self):
+        self.state: str | None = None
+        self.image: str | None = None
+        self.image_hash: str | None = None
+        self.health: str | None = None
+        self.status: str | None = None
+        self.uptime: str | None = None
+        self.network_available: bool | None = None
+
+    #############################################################
+    def as_dict(self) -> dict[str, Any]:
+        """Return the information as dictionary, empty if not inspected yet."""
+
+        if self.state is None:
+            return {}
+
+        return {
+            CONTAINER_INFO_STATE: self.state,
+            CONTAINER_INFO_IMAGE: self.image,
+            CONTAINER_INFO_IMAGE_HASH: self.image_hash,
+            CONTAINER_INFO_HEALTH: self.health,
+            CONTAINER_INFO_STATUS: self.status,
+            CONTAINER_INFO_UPTIME: self.uptime,
+            CONTAINER_INFO_NETWORK_AVAILABLE: self.network_available,
+        }
+
+
+#################################################################
+class DockerContainerStats:
+    """Container stats of the last sample, updated in place."""
+
+    __slots__ = (
+        "read",
+        "cpu_percentage",
+        "cpu1_percentage",
+        "memory",
+        "memory_percentage",
+        "network_speed_up",
+        "network_speed_down",
+        "network_total_up",
+        "network_total_down",
+    )
+
+    def __init__(self):
+        self.clear()
+
+    #############################################################
+    def clear(self) -> None:
+        """Forget the last sample."""
+        self.read: datetime | None = None
+        self.cpu_percentage: float | None = None
+        self.cpu1_percentage: float | None = None
+        self.memory: float | None = None
+        self.memory_percentage: float | None = None
+        self.network_speed_up: float | None = None
+        self.network_speed_down: float | None = None
+        self.network_total_up: float | None = None
+        self.network_total_down: float | None = None
+
+    #############################################################
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as dictionary, empty if there is no sample yet."""
+
+        if self.read is None:
+            return {}
+
+        return {
+            "read": self.read,
+            CONTAINER_STATS_CPU_PERCENTAGE: self.cpu_percentage,
+            CONTAINER_STATS_1CPU_PERCENTAGE: self.cpu1_percentage,
+            CONTAINER_STATS_MEMORY: self.memory,
+            CONTAINER_STATS_MEMORY_PERCENTAGE: self.memory_percentage,
+            CONTAINER_STATS_NETWORK_SPEED_UP: self.network_speed_up,
+            CONTAINER_STATS_NETWORK_SPEED_DOWN: self.network_speed_down,
+            CONTAINER_STATS_NETWORK_TOTAL_UP: self.network_total_up,
+            CONTAINER_STATS_NETWORK_TOTAL_DOWN: self.network_total_down,
+        }
+
+
 #################################################################
 class DockerContainerAPI:
     """Docker Container API abstraction."""
@@ -822,20 +2013,29 @@ class DockerContainerAPI:
         api: aiodocker.Docker,
         cname: str,
         atInit=True,
+        oneshot=False,
+        aggregate: Callable | None = None,
     ):
         self._config = config
         self._api = api
         self._instance: str = config[CONF_NAME]
         self._memChange: int = config[CONF_MEMORYCHANGE]
         self._name = cname
-        self._interval: int = config[CONF_SCAN_INTERVAL].seconds
+        self._set_interval()
         self._retry_interval: int = config[CONF_RETRY]
+        self._timeouts: dict[str, int] = config[CONF_TIMEOUTS]
+        self._backoff = DockerBackoff(self._retry_interval)
+        self._stats_breaker = DockerBackoff(self._interval)
+        self._adaptive_tolerance: int = config[CONF_ADAPTIVE_TOLERANCE]
+        self._adaptive_ref: tuple | None = None
         self._busy = False
         self._atInit = atInit
-        self._task: asyncio.Task | None = None
+        self._container: aiodocker.containers.DockerContainer | None = None
+        self._next_poll = 0.0
         self._subscribers: list[Callable] = []
-        self._cpu_old: dict[str, int] = {}
-        self._network_old: dict[str, int | datetime] = {}
+        self._poll_notify = False
+        self._cpu_old = DockerCpuCounters()
+        self._network_old = DockerNetworkCounters()
         self._network_error = 0
         self._memory_error = 0
         self._cpu_error = 0
@@ -843,17 +2043,48 @@ class DockerContainerAPI:
         self._memory_prev_breach = False
         self._memory_percent_prev: float | None = None
         self._memory_percent_prev_breach = False
-
-        self._info: dict[str, Any] = {}
-        self._stats: dict[str, Any] = {}
-
-    async def init(self):
+        self._stats_stream: bool = config[CONF_STATS_STREAM]
+        self._stats_oneshot: bool = oneshot
+        self._info_batch: bool = config[CONF_INFO_BATCH]
+        self._inspect_interval: int = config[CONF_INSPECT_INTERVAL]
+        self._inspect: dict[str, Any] | None = None
+        self._inspect_time = 0.0
+        self._inspect_pending = False
+        self._list_info: dict[str, Any] | None = None
+        self._cgroup_raw: dict[str, Any] | None = None
+        self._available = True
+        self._stream_task: asyncio.Task | None = None
+        self._stream_time = 0.0
+        self._stream_raw: dict[str, Any] | None = None
+        self._stream_used: dict[str, Any] | None = None
+
+        self._aggregate = aggregate
+        self._contribution: tuple[float, float] = (0.0, 0.0)
+
+        # Updated in place, get_info/get_stats return a dictionary view which
+        # is only rebuilt after a change
+        self._info = DockerContainerInfo()
+        self._stats = DockerContainerStats()
+        self._info_view: dict[str, Any] | None = None
+        self._stats_view: dict[str, Any] | None = None
+
+    async def init(
+        self, container: aiodocker.containers.DockerContainer | None = None
+    ) -> bool:
         # During start-up we will wait on container attachment,
         # preventing concurrency issues the main HA loop (we are
         # othside that one with our threads)
         if self._atInit:
+            # The container from the list is enough, it only needs the id
+            if container is not None:
+                self._container = container
+                return True
+
             try:
-                self._container = await self._api.containers.get(self._name)
+                self._container = await asyncio.wait_for(
+                    self._api.containers.get(self._name),
+                    self._timeouts[TIMEOUT_INSPECT],
+                )
             except Exception as err:
                 exc_info = True if str(err) == "" else False
                 _LOGGER.error(
@@ -863,9 +2094,9 @@ class DockerContainerAPI:
                     str(err),
                     exc_info=exc_info,
                 )
-                return
+                return False
 
-            self._task = asyncio.create_task(self._run())
+        return True
 
     #############################################################
     async def _initGetContainer(self) -> bool:
@@ -874,7 +2105,9 @@ class DockerContainerAPI:
         # in a running loop.
 
         try:
-            self._container = await self._api.containers.get(self._name)
+            self._container = await asyncio.wait_for(
+                self._api.containers.get(self._name), self._timeouts[TIMEOUT_INSPECT]
+            )
         except aiodocker.exceptions.DockerError as err:
             _LOGGER.error(
                 "[%s] %s: Container not available anymore (2a) (%s)",
@@ -882,132 +2115,379 @@ class DockerContainerAPI:
                 self._name,
                 str(err),
             )
-            return False
+            return False
+        except Exception as err:
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s] %s: Container not available anymore (2b) (%s)",
+                self._instance,
+                self._name,
+                str(err),
+                exc_info=exc_info,
+            )
+            return False
+
+        return True
+
+    #############################################################
+    def poll_due(self, cycle: float) -> bool:
+        """Check if the container should be polled in this cycle. With a small
+        margin, the tick times are sums of floats."""
+        return cycle + 0.01 >= self._next_poll
+
+    #############################################################
+    async def poll(self, cycle: float) -> bool | None:
+        """Gather container info/stats, called by the scheduler. Returns if
+        the poll succeeded, None if the container was busy."""
+
+        sendNotify = True
+        error = True
+
+        try:
+            # Don't check container if we are doing a start/stop
+            if not self._busy:
+                await self._run_container_info()
+
+                # Only run stats if container is running
+                if self._info.state in ("running", "paused"):
+                    if self._stats_stream and self._cgroup_raw is None:
+                        self._start_stats_stream()
+                    await self._run_container_stats_breaker()
+                elif self._stats_stream:
+                    self._stop_stats_stream()
+            else:
+                _LOGGER.debug(
+                    "[%s] %s: Waiting on stop/start of container",
+                    self._instance,
+                    self._name,
+                )
+                sendNotify = False
+
+            # No error, so normal interval
+            error = False
+
+        except concurrent.futures._base.CancelledError:
+            _LOGGER.debug(
+                "[%s] %s: Container received concurrent.futures._base.CancelledError",
+                self._instance,
+                self._name,
+            )
+            return None
+        except aiodocker.exceptions.DockerError as err:
+            _LOGGER.error(
+                "[%s] %s: Container not available anymore (3a) (%s)",
+                self._instance,
+                self._name,
+                str(err),
+            )
+        except asyncio.exceptions.CancelledError:
+            # Removed from the scheduler, e.g. the container is destroyed
+            _LOGGER.debug(
+                "[%s] %s: Container poll cancelled",
+                self._instance,
+                self._name,
+            )
+            raise
+        except asyncio.TimeoutError as err:
+            _LOGGER.error(
+                "[%s] %s: Container not available anymore (3d) TimeoutError",
+                self._instance,
+                self._name,
+            )
         except Exception as err:
             exc_info = True if str(err) == "" else False
             _LOGGER.error(
-                "[%s] %s: Container not available anymore (2b) (%s)",
+                "[%s] %s: Container not available anymore (3b) (%s)",
                 self._instance,
                 self._name,
                 str(err),
                 exc_info=exc_info,
             )
-            return False
 
-        self._task = asyncio.create_task(self._run())
+        # Send values to sensors/switch
+        if sendNotify:
+            self._set_contribution()
+            self._notify(poll=True)
 
-        return True
+        # Next poll in normal and exception situation, back off on errors
+        if error:
+            delay = self._backoff.failure()
+            _LOGGER.debug(
+                "[%s] %s: Poll failed %d time(s), retry in %d seconds",
+                self._instance,
+                self._name,
+                self._backoff.failures,
+                delay,
+            )
+            self._next_poll = cycle + delay
+            return False
 
-    #############################################################
-    async def _run(self) -> None:
-        """Loop to gather container info/stats."""
+        self._backoff.success()
 
-        while True:
+        if self._adaptive and sendNotify:
+            self._adapt_interval()
 
-            sendNotify = True
-            error = True
+        self._next_poll = cycle + self._poll_interval
 
-            try:
-                # Don't check container if we are doing a start/stop
-                if not self._busy:
-                    await self._run_container_info()
+        return True if sendNotify else None
 
-                    # Only run stats if container is running
-                    if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-                        await self._run_container_stats()
-                else:
-                    _LOGGER.debug(
-                        "[%s] %s: Waiting on stop/start of container",
-                        self._instance,
-                        self._name,
-                    )
-                    sendNotify = False
+    #############################################################
+    async def _run_container_stats_breaker(self) -> None:
+        """Run the stats, unless the circuit breaker is open. The stats of a
+        container which keep failing, e.g. stuck in removal, are only probed
+        after the backoff delay."""
 
-                # No error, so normal interval
-                error = False
+        if not self._stats_breaker.allow():
+            return
 
-            except concurrent.futures._base.CancelledError:
-                _LOGGER.debug(
-                    "[%s] %s: Container received concurrent.futures._base.CancelledError",
-                    self._instance,
-                    self._name,
-                )
-                pass
-                break
-            except aiodocker.exceptions.DockerError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3a) (%s). Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    str(err),
-                    self._retry_interval,
-                )
-            except asyncio.exceptions.CancelledError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3c) CancelledError. Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    self._retry_interval,
-                )
-            except asyncio.TimeoutError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3d) TimeoutError. Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    self._retry_interval,
-                )
-            except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3b) (%s). Retry in %d seconds",
+        try:
+            await self._run_container_stats()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            # Only the stats failed, the info of the poll is still valid
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s] %s: Cannot get container stats (%s)",
+                self._instance,
+                self._name,
+                str(err),
+                exc_info=exc_info,
+            )
+
+            delay = self._stats_breaker.failure()
+            if self._stats_breaker.failures == BREAKER_THRESHOLD:
+                _LOGGER.warning(
+                    "[%s] %s: Stats failed %d times, next try in %d seconds or more",
                     self._instance,
                     self._name,
-                    str(err),
-                    self._retry_interval,
-                    exc_info=exc_info,
+                    BREAKER_THRESHOLD,
+                    delay,
                 )
 
-            # Send values to sensors/switch
-            if sendNotify:
-                self._notify()
+                # Don't show the last stats as if they are current
+                self._stats.clear()
+                self._stats_view = None
+                self.clear_contribution()
+            return
 
-            # TODO: on error, increase sleep
+        if self._stats_breaker.success():
+            _LOGGER.info("[%s] %s: Stats available again", self._instance, self._name)
 
-            # Sleep in normal and exception situation
-            if error:
-                await asyncio.sleep(self._retry_interval)
-            else:
-                await asyncio.sleep(self._interval)
+    #############################################################
+    def _set_contribution(self) -> None:
+        """Update our part of the host CPU/memory totals, only running containers."""
+
+        new = (0.0, 0.0)
+        if self._info.state == "running":
+            new = (self._stats.cpu_percentage or 0.0, self._stats.memory or 0.0)
+
+        if new != self._contribution and self._aggregate is not None:
+            self._aggregate(self._contribution, new)
+
+        self._contribution = new
+
+    #############################################################
+    def clear_contribution(self) -> None:
+        """Remove our part of the host CPU/memory totals."""
+
+        if self._aggregate is not None:
+            self._aggregate(self._contribution, (0.0, 0.0))
+
+        self._contribution = (0.0, 0.0)
+
+    #############################################################
+    def _adapt_interval(self) -> None:
+        """Grow the poll interval while the container is idle, otherwise
+        snap back to the minimum interval."""
+
+        sample = (
+            self._info.state,
+            self._stats.cpu_percentage,
+            self._stats.memory,
+            self._stats.network_speed_up,
+            self._stats.network_speed_down,
+        )
+
+        if self._adaptive_ref is not None and all(
+            self._within_tolerance(new, ref)
+            for new, ref in zip(sample, self._adaptive_ref)
+        ):
+            self._poll_interval = min(self._poll_interval * 2, self._interval_max)
+        else:
+            self._adaptive_ref = sample
+            self._poll_interval = self._interval_min
+
+        _LOGGER.debug(
+            "[%s] %s: Adaptive poll interval %d seconds",
+            self._instance,
+            self._name,
+            self._poll_interval,
+        )
+
+    #############################################################
+    def _within_tolerance(self, new: Any, ref: Any) -> bool:
+        """Check if a value is unchanged, changes below 1 (%, MB, kB/s) are ignored."""
+
+        if not isinstance(new, (int, float)) or not isinstance(ref, (int, float)):
+            return new == ref
+
+        return abs(new - ref) <= max(abs(ref) * self._adaptive_tolerance / 100, 1.0)
+
+    #############################################################
+    def reset_interval(self) -> None:
+        """Poll at the minimum interval again, e.g. after a Docker event."""
+
+        if self._adaptive:
+            self._adaptive_ref = None
+            self._poll_interval = self._interval_min
+            self._next_poll = 0.0
 
     #############################################################
     async def _run_container_info(self) -> None:
         """Get container information, but we can not get
         the uptime of this container, that is only available
-        while listing all containers :-(.
+        while listing all containers :-(. With the batched
+        container list, we only inspect on a change.
         """
 
-        self._info = {}
+        if self._inspect_needed():
+            # An event during the inspect sets the flag again, the inspect
+            # can then be older than the event
+            self._inspect_pending = False
+            try:
+                self._inspect = await asyncio.wait_for(
+                    self._container.show(), self._timeouts[TIMEOUT_INSPECT]
+                )
+            except BaseException:
+                self._inspect_pending = True
+                raise
+
+            if not self._inspect_pending:
+                self._inspect_time = time.monotonic()
+
+        self._update_info(self._inspect)
+
+    #############################################################
+    def set_list_info(self, raw: dict[str, Any] | None) -> None:
+        """Set container information from the batched container list."""
+        self._list_info = raw
+
+    #############################################################
+    def _inspect_needed(self) -> bool:
+        """Check if the container list still matches our last inspect. Events
+        keep the inspect up-to-date, so it is only a slow reconciliation."""
+
+        if self._inspect is None or self._inspect_pending:
+            return True
+
+        if time.monotonic() - self._inspect_time >= self._inspect_interval:
+            return True
+
+        if not self._info_batch:
+            return False
+
+        if self._list_info is None:
+            return True
+
+        state = self._list_info.get("State")
+        if state != self._inspect["State"]["Status"]:
+            return True
+
+        if self._list_info.get("ImageID") != self._inspect["Image"]:
+            return True
+
+        # Health is only part of the status of a running container
+        if state == "running" and self._list_health(
+            self._list_info.get("Status", "")
+        ) != self._inspect["State"].get("Health", {}).get("Status", "unknown"):
+            return True
+
+        return False
+
+    #############################################################
+    def event_update(self, event: dict[str, Any]) -> None:
+        """Update the container state/health directly from a Docker event,
+        the next poll does a full inspect to reconcile."""
+
+        action = event["Action"]
+        attributes = event["Actor"].get("Attributes", {})
+
+        _LOGGER.debug(
+            "[%s] %s: Event %s, updating state", self._instance, self._name, action
+        )
+
+        self._inspect_pending = True
+        self.reset_interval()
+
+        if self._inspect is None:
+            return
+
+        if "timeNano" in event:
+            eventTime = datetime.fromtimestamp(event["timeNano"] / 1e9, timezone.utc)
+        else:
+            eventTime = datetime.now(timezone.utc)
+
+        state = self._inspect["State"]
+
+        if action in ("start", "restart"):
+            state["Status"] = "running"
+            state["StartedAt"] = eventTime.isoformat()
+        elif action == "die":
+            state["Status"] = "exited"
+            state["FinishedAt"] = eventTime.isoformat()
+            if "exitCode" in attributes:
+                state["ExitCode"] = int(attributes["exitCode"])
+        elif action == "stop":
+            state["Status"] = "exited"
+        elif action == "pause":
+            state["Status"] = "paused"
+        elif action == "unpause":
+            state["Status"] = "running"
+        elif action == "oom":
+            state["OOMKilled"] = True
+        elif action.startswith("health_status:"):
+            state.setdefault("Health", {})["Status"] = action.split(":", 1)[1].strip()
+
+        self._update_info(self._inspect)
+        self._set_contribution()
+        self._notify()
+
+    #############################################################
+    @staticmethod
+    def _list_health(status: str) -> str:
+        """Get the health from the container list status, e.g. Up 6 days (healthy)."""
+        if "(unhealthy)" in status:
+            return "unhealthy"
+        elif "(healthy)" in status:
+            return "healthy"
+        elif "(health: starting)" in status:
+            return "starting"
+
+        return "unknown"
 
-        raw: dict = await self._container.show()
+    #############################################################
+    def _update_info(self, raw: dict[str, Any]) -> None:
+        """Update the container information from the inspect data."""
+
+        info = self._info
 
-        self._info[CONTAINER_INFO_STATE] = raw["State"]["Status"]
-        self._info[CONTAINER_INFO_IMAGE] = raw["Config"]["Image"]
-        self._info[CONTAINER_INFO_IMAGE_HASH] = raw["Image"]
+        info.state = raw["State"]["Status"]
+        info.image = raw["Config"]["Image"]
+        info.image_hash = raw["Image"]
 
         if self._network_error <= 5:
-            if CONTAINER_INFO_NETWORK_AVAILABLE not in self._info:
-                self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = (
-                    False
-                    if raw["HostConfig"]["NetworkMode"] in ["host", "none"]
-                    else True
-                )
+            info.network_available = raw["HostConfig"]["NetworkMode"] not in [
+                "host",
+                "none",
+            ]
         else:
-            self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
+            info.network_available = False
 
         try:
-            self._info[CONTAINER_INFO_HEALTH] = raw["State"]["Health"]["Status"]
+            info.health = raw["State"]["Health"]["Status"]
         except:
-            self._info[CONTAINER_INFO_HEALTH] = "unknown"
+            info.health = "unknown"
 
         # We only do a calculation of startedAt, because we use it twice
         startedAt = parser.parse(raw["State"]["StartedAt"])
@@ -1018,91 +2498,120 @@ class DockerContainerAPI:
         # Exited (0) 2 months ago
         # Restarting (99) 5 seconds ago
 
-        if self._info[CONTAINER_INFO_STATE] == "running":
-            self._info[CONTAINER_INFO_STATUS] = "Up {}".format(
-                self._calcdockerformat(startedAt)
-            )
-        elif self._info[CONTAINER_INFO_STATE] == "exited":
-            self._info[CONTAINER_INFO_STATUS] = "Exited ({}) {} ago".format(
+        if info.state == "running":
+            info.status = "Up {}".format(self._calcdockerformat(startedAt))
+        elif info.state == "exited":
+            info.status = "Exited ({}) {} ago".format(
                 raw["State"]["ExitCode"],
                 self._calcdockerformat(parser.parse(raw["State"]["FinishedAt"])),
             )
-        elif self._info[CONTAINER_INFO_STATE] == "created":
-            self._info[CONTAINER_INFO_STATUS] = "Created {} ago".format(
+        elif info.state == "created":
+            info.status = "Created {} ago".format(
                 self._calcdockerformat(parser.parse(raw["Created"]))
             )
-        elif self._info[CONTAINER_INFO_STATE] == "restarting":
-            self._info[CONTAINER_INFO_STATUS] = "Restarting"
-        elif self._info[CONTAINER_INFO_STATE] == "paused":
-            self._info[CONTAINER_INFO_STATUS] = "Up {} (Paused)".format(
-                self._calcdockerformat(startedAt)
-            )
+        elif info.state == "restarting":
+            info.status = "Restarting"
+        elif info.state == "paused":
+            info.status = "Up {} (Paused)".format(self._calcdockerformat(startedAt))
         else:
-            self._info[CONTAINER_INFO_STATUS] = "None ({})".format(
-                raw["State"]["Status"]
-            )
+            info.status = "None ({})".format(raw["State"]["Status"])
 
-        if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-            self._info[CONTAINER_INFO_UPTIME] = dt_util.as_local(startedAt).isoformat()
+        if info.state in ("running", "paused"):
+            info.uptime = dt_util.as_local(startedAt).isoformat()
         else:
-            self._info[CONTAINER_INFO_UPTIME] = None
-            _LOGGER.debug(
-                "[%s] %s: %s",
-                self._instance,
-                self._name,
-                self._info[CONTAINER_INFO_STATUS],
-            )
+            info.uptime = None
+            _LOGGER.debug("[%s] %s: %s", self._instance, self._name, info.status)
+
+        self._info_view = None
 
     #############################################################
     async def _run_container_stats(self) -> None:
-        # Initialize stats information
-        stats: dict[str, Any] = {}
-        stats["cpu"] = {}
-        stats["memory"] = {}
-        stats["network"] = {}
-        stats["read"] = {}
+        fromCgroup = False
+
+        if self._cgroup_raw is not None:
+            # Already read from the cgroup files, before the poll cycle
+            raw = self._cgroup_raw
+            self._cgroup_raw = None
+            fromCgroup = True
+        elif self._stats_stream:
+            # Use the newest frame of the stats stream, skip if nothing new arrived
+            raw = self._stream_raw
+            if raw is None or raw is self._stream_used:
+                return
+            self._stream_used = raw
+        elif self._stats_oneshot:
+            # Get container stats without pre-sample, CPU delta is calculated by us
+            try:
+                raw = await asyncio.wait_for(
+                    self._api._query_json(
+                        f"containers/{self._container.id}/stats",
+                        params={"stream": "0", "one-shot": "1"},
+                    ),
+                    self._timeouts[TIMEOUT_STATS],
+                )
+            except aiodocker.exceptions.DockerError as err:
+                if err.status != 400:
+                    raise
 
-        # Get container stats, only interested in [0]
-        rawarr = await self._container.stats(stream=False)
+                _LOGGER.warning(
+                    "[%s] %s: One-shot stats not supported (%s), falling back",
+                    self._instance,
+                    self._name,
+                    str(err),
+                )
+                self._stats_oneshot = False
+                return
 
-        # Could be out-of-range when stopping/renaming
-        try:
-            raw: dict[str, Any] = rawarr[0]
-        except IndexError:
-            return
+            if not raw:
+                return
+        else:
+            # Get container stats, only interested in [0]
+            rawarr = await asyncio.wait_for(
+                self._container.stats(stream=False), self._timeouts[TIMEOUT_STATS]
+            )
+
+            # Could be out-of-range when stopping/renaming
+            try:
+                raw: dict[str, Any] = rawarr[0]
+            except IndexError:
+                return
 
-        stats["read"] = parser.parse(raw["read"])
+        read = parser.parse(raw["read"])
 
         # Gather CPU information
-        cpu_stats = {}
+        cpu_total: float | None = None
+        online_cpus: int | None = None
         try:
-            cpu_new = {}
-            cpu_new["total"] = raw["cpu_stats"]["cpu_usage"]["total_usage"]
-            cpu_new["system"] = raw["cpu_stats"]["system_cpu_usage"]
+            total = raw["cpu_stats"]["cpu_usage"]["total_usage"]
+            system = raw["cpu_stats"]["system_cpu_usage"]
+
+            # Not available at all times, e.g. unreadable host CPU time
+            if total is None or system is None:
+                raise KeyError("system_cpu_usage")
 
             # Compatibility wih older Docker API
             if "online_cpus" in raw["cpu_stats"]:
-                cpu_stats["online_cpus"] = raw["cpu_stats"]["online_cpus"]
+                online_cpus = raw["cpu_stats"]["online_cpus"]
             else:
-                cpu_stats["online_cpus"] = len(
-                    raw["cpu_stats"]["cpu_usage"]["percpu_usage"] or []
-                )
+                online_cpus = len(raw["cpu_stats"]["cpu_usage"]["percpu_usage"] or [])
 
             # Calculate cpu usage, but first iteration we don't know it
             if self._cpu_old:
-                cpu_delta = float(cpu_new["total"] - self._cpu_old["total"])
-                system_delta = float(cpu_new["system"] - self._cpu_old["system"])
-
-                cpu_stats["total"] = round(0.0, PRECISION)
+                cpu_delta = float(total - self._cpu_old.total)
+                system_delta = float(system - self._cpu_old.system)
+
+                # The counters went backwards, e.g. the old sample is from a
+                # snapshot before a reboot, or the container restarted. Then
+                # the usage is unknown, like for the first sample
+                if cpu_delta >= 0.0 and system_delta >= 0.0:
+                    cpu_total = round(0.0, PRECISION)
                 if cpu_delta > 0.0 and system_delta > 0.0:
-                    cpu_stats["total"] = round(
-                        (cpu_delta / system_delta)
-                        * float(cpu_stats["online_cpus"])
-                        * 100.0,
+                    cpu_total = round(
+                        (cpu_delta / system_delta) * float(online_cpus) * 100.0,
                         self._config[CONF_PRECISION_CPU],
                     )
 
-            self._cpu_old = cpu_new
+            self._cpu_old.update(read, total, system)
 
             if self._cpu_error > 0:
                 _LOGGER.debug(
@@ -1137,11 +2646,10 @@ class DockerContainerAPI:
             self._cpu_error += 1
 
         # Gather memory information
-        memory_stats: dict[str, float | None] = {}
+        memory_usage: float | None = None
+        memory_percent: float | None = None
 
         try:
-            memory_stats["usage"] = None
-
             cache = 0
             # https://docs.docker.com/engine/reference/commandline/stats/
             if "stats" in raw["memory_stats"]:
@@ -1150,15 +2658,15 @@ class DockerContainerAPI:
                 elif "inactive_file" in raw["memory_stats"]["stats"]:
                     cache = raw["memory_stats"]["stats"]["inactive_file"]
 
-            memory_stats["usage"] = toMB(
+            memory_usage = toMB(
                 raw["memory_stats"]["usage"] - cache,
                 self._config[CONF_PRECISION_MEMORY_MB],
             )
-            memory_stats["limit"] = toMB(
+            memory_limit = toMB(
                 raw["memory_stats"]["limit"], self._config[CONF_PRECISION_MEMORY_MB]
             )
-            memory_stats["usage_percent"] = round(
-                float(memory_stats["usage"]) / float(memory_stats["limit"]) * 100.0,
+            memory_percent = round(
+                float(memory_usage) / float(memory_limit) * 100.0,
                 self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
             )
 
@@ -1200,21 +2708,17 @@ class DockerContainerAPI:
             "[%s] %s: CPU: %s%%, Memory: %sMB, %s%%",
             self._instance,
             self._name,
-            cpu_stats.get("total", None),
-            memory_stats.get("usage", None),
-            memory_stats.get("usage_percent", None),
+            cpu_total,
+            memory_usage,
+            memory_percent,
         )
 
         # Default value
         mem_breach = False
 
         # Try to figure out if we should report the memory value or not
-        if (
-            memory_stats.get("usage", None)
-            and self._memory_prev
-            and not self._memory_prev_breach
-        ):
-            mem_diff = abs((memory_stats["usage"] / self._memory_prev) - 1) * 100
+        if memory_usage and self._memory_prev and not self._memory_prev_breach:
+            mem_diff = abs((memory_usage / self._memory_prev) - 1) * 100
 
             if self._memChange < 100 and mem_diff >= self._memChange:
                 mem_breach = True
@@ -1224,7 +2728,7 @@ class DockerContainerAPI:
                 self._instance,
                 self._name,
                 round(mem_diff, 3),
-                memory_stats.get("usage", None),
+                memory_usage,
                 self._memory_prev,
                 mem_breach,
             )
@@ -1248,58 +2752,50 @@ class DockerContainerAPI:
             # Store values into previous
             tmp1 = self._memory_prev
             tmp2 = self._memory_percent_prev
-            self._memory_prev = memory_stats.get("usage", None)
+            self._memory_prev = memory_usage
             self._memory_prev_breach = mem_breach
-            self._memory_percent_prev = memory_stats.get("usage_percent", None)
-            memory_stats["usage"] = tmp1
-            memory_stats["usage_percent"] = tmp2
+            self._memory_percent_prev = memory_percent
+            memory_usage = tmp1
+            memory_percent = tmp2
         else:
             # Store values into previous
-            self._memory_prev = memory_stats.get("usage", None)
+            self._memory_prev = memory_usage
             self._memory_prev_breach = mem_breach
-            self._memory_percent_prev = memory_stats.get("usage_percent", None)
+            self._memory_percent_prev = memory_percent
 
         # Gather network information, doesn't work in network=host mode
-        network_stats: dict[str, int | float] = {}
-        if self._info[CONTAINER_INFO_NETWORK_AVAILABLE]:
+        speed_tx: float | None = None
+        speed_rx: float | None = None
+        total_tx: float | None = None
+        total_rx: float | None = None
+        if self._info.network_available and (not fromCgroup or "networks" in raw):
             try:
-                network_new = {}
-                network_stats["total_tx"] = 0
-                network_stats["total_rx"] = 0
+                bytes_tx = 0
+                bytes_rx = 0
                 for if_name, data in raw["networks"].items():
-                    network_stats["total_tx"] += data["tx_bytes"]
-                    network_stats["total_rx"] += data["rx_bytes"]
-
-                network_new = {
-                    "read": stats["read"],
-                    "total_tx": network_stats["total_tx"],
-                    "total_rx": network_stats["total_rx"],
-                }
+                    bytes_tx += data["tx_bytes"]
+                    bytes_rx += data["rx_bytes"]
 
                 if self._network_old:
-                    tx = network_new["total_tx"] - self._network_old["total_tx"]
-                    rx = network_new["total_rx"] - self._network_old["total_rx"]
-                    tim = (
-                        network_new["read"] - self._network_old["read"]
-                    ).total_seconds()
-
-                    # Calculate speed, also convert to kByte/sec
-                    network_stats["speed_tx"] = toKB(
-                        float(tx) / tim, self._config[CONF_PRECISION_NETWORK_KB]
-                    )
-                    network_stats["speed_rx"] = toKB(
-                        float(rx) / tim, self._config[CONF_PRECISION_NETWORK_KB]
-                    )
+                    tx = bytes_tx - self._network_old.total_tx
+                    rx = bytes_rx - self._network_old.total_rx
+                    tim = (read - self._network_old.read).total_seconds()
+
+                    # Calculate speed, also convert to kByte/sec. The counters
+                    # are reset if the container restarted
+                    if tx >= 0 and rx >= 0 and tim > 0:
+                        speed_tx = toKB(
+                            float(tx) / tim, self._config[CONF_PRECISION_NETWORK_KB]
+                        )
+                        speed_rx = toKB(
+                            float(rx) / tim, self._config[CONF_PRECISION_NETWORK_KB]
+                        )
 
-                self._network_old = network_new
+                self._network_old.update(read, bytes_tx, bytes_rx)
 
                 # Convert total to MB
-                network_stats["total_tx"] = toMB(
-                    network_stats["total_tx"], self._config[CONF_PRECISION_NETWORK_MB]
-                )
-                network_stats["total_rx"] = toMB(
-                    network_stats["total_rx"], self._config[CONF_PRECISION_NETWORK_MB]
-                )
+                total_tx = toMB(bytes_tx, self._config[CONF_PRECISION_NETWORK_MB])
+                total_rx = toMB(bytes_rx, self._config[CONF_PRECISION_NETWORK_MB])
 
             except KeyError as err:
                 _LOGGER.error(
@@ -1331,44 +2827,117 @@ class DockerContainerAPI:
                         self._instance,
                         self._name,
                     )
-                    self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
+                    self._info.network_available = False
+                    self._info_view = None
 
         # All information collected
-        stats["cpu"] = cpu_stats
-        stats["memory"] = memory_stats
-        stats["network"] = network_stats
-
-        stats[CONTAINER_STATS_CPU_PERCENTAGE] = cpu_stats.get("total")
-        if "online_cpus" in cpu_stats and cpu_stats.get("total") is not None:
-            stats[CONTAINER_STATS_1CPU_PERCENTAGE] = round(
-                cpu_stats.get("total") / cpu_stats["online_cpus"],
-                self._config[CONF_PRECISION_CPU],
+        stats = self._stats
+
+        stats.read = read
+        stats.cpu_percentage = cpu_total
+        stats.cpu1_percentage = None
+        if online_cpus and cpu_total is not None:
+            stats.cpu1_percentage = round(
+                cpu_total / online_cpus, self._config[CONF_PRECISION_CPU]
             )
 
-        stats[CONTAINER_STATS_MEMORY] = memory_stats.get("usage")
-        stats[CONTAINER_STATS_MEMORY_PERCENTAGE] = memory_stats.get("usage_percent")
-        stats[CONTAINER_STATS_NETWORK_SPEED_UP] = network_stats.get("speed_tx")
-        stats[CONTAINER_STATS_NETWORK_SPEED_DOWN] = network_stats.get("speed_rx")
-        stats[CONTAINER_STATS_NETWORK_TOTAL_UP] = network_stats.get("total_tx")
-        stats[CONTAINER_STATS_NETWORK_TOTAL_DOWN] = network_stats.get("total_rx")
+        stats.memory = memory_usage
+        stats.memory_percentage = memory_percent
+        stats.network_speed_up = speed_tx
+        stats.network_speed_down = speed_rx
+        stats.network_total_up = total_tx
+        stats.network_total_down = total_rx
 
-        self._stats = stats
+        self._stats_view = None
 
     #############################################################
-    def cancel_task(self) -> None:
-        if self._task is not None:
-            _LOGGER.info(
-                "[%s] %s: Cancelling task for container info/stats",
+    def _start_stats_stream(self) -> None:
+        """Start the stats stream task, if it isn't running already."""
+        if self._stream_task is not None and not self._stream_task.done():
+            return
+
+        _LOGGER.debug("[%s] %s: Starting stats stream", self._instance, self._name)
+        self._stream_time = time.monotonic()
+        self._stream_task = asyncio.create_task(self._run_stats_stream())
+
+    #############################################################
+    def check_stream(self, deadline: float) -> None:
+        """Stop a stats stream without new frames within the deadline, the
+        next poll starts a new stream."""
+
+        if self._stream_task is None or self._stream_task.done():
+            return
+
+        if time.monotonic() - self._stream_time > deadline:
+            _LOGGER.warning(
+                "[%s] %s: Stats stream stalled for more than %d seconds, restarting",
                 self._instance,
                 self._name,
+                deadline,
             )
-            self._task.cancel()
-        else:
-            _LOGGER.info(
-                "[%s] %s: Task (not running) can not be cancelled for container info/stats",
+            self._stop_stats_stream()
+
+    #############################################################
+    def _stop_stats_stream(self) -> asyncio.Task | None:
+        """Stop the stats stream task, e.g. when container is not running.
+        Returns the cancelled task."""
+        cancelled = None
+
+        if self._stream_task is not None:
+            if not self._stream_task.done():
+                _LOGGER.debug(
+                    "[%s] %s: Stopping stats stream", self._instance, self._name
+                )
+                self._stream_task.cancel()
+                cancelled = self._stream_task
+            self._stream_task = None
+
+        self._stream_raw = None
+        self._stream_used = None
+
+        return cancelled
+
+    #############################################################
+    async def _run_stats_stream(self) -> None:
+        """Keep 1 stats subscription open and remember the newest frame.
+        Our own TCP session has no total timeout, the default session of the
+        Unix socket closes the stream after 5 minutes. The next poll then
+        starts a new stream.
+        """
+
+        try:
+            async for raw in self._container.stats(stream=True):
+                self._stream_raw = raw
+                self._stream_time = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            _LOGGER.debug(
+                "[%s] %s: Stats stream reached the session timeout",
                 self._instance,
                 self._name,
             )
+        except Exception as err:
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s] %s: Stats stream ended (%s)",
+                self._instance,
+                self._name,
+                str(err),
+                exc_info=exc_info,
+            )
+        finally:
+            self._stream_raw = None
+
+    #############################################################
+    def cancel_task(self) -> asyncio.Task | None:
+        """Polling is stopped by the scheduler, only the stats stream is ours."""
+        _LOGGER.info(
+            "[%s] %s: Cancelling task for container stats stream",
+            self._instance,
+            self._name,
+        )
+        return self._stop_stats_stream()
 
     #############################################################
     def rename_entities_containername(self) -> None:
@@ -1390,14 +2959,40 @@ class DockerContainerAPI:
         for callback in self._subscribers:
             callback(remove=True)
 
-        self._subscriber: list[Callable] = []
+        self._subscribers = []
+
+    #############################################################
+    def suspend(self) -> None:
+        """Connection with Docker is lost, the entities become unavailable."""
+        self._available = False
+        self._stop_stats_stream()
+        self._notify()
+
+    #############################################################
+    def resume(
+        self, api: aiodocker.Docker, container: aiodocker.containers.DockerContainer
+    ) -> None:
+        """Continue with the new connection, the counters are kept. The state
+        can be changed during the outage, so do a full inspect."""
+        self._api = api
+        self._container = container
+        self._available = True
+        self._inspect_pending = True
+        self.reset_interval()
+
+    #############################################################
+    def is_available(self) -> bool:
+        """Return if the connection with Docker is working."""
+        return self._available
 
     #############################################################
     async def _start(self) -> None:
         """Separate loop to start container, because HA loop can't be used."""
 
         try:
-            await self._container.start()
+            await asyncio.wait_for(
+                self._container.start(), self._timeouts[TIMEOUT_ACTION]
+            )
         except Exception as err:
             _LOGGER.error(
                 "[%s] %s: Can not start container (%s)",
@@ -1420,7 +3015,9 @@ class DockerContainerAPI:
     async def _stop(self) -> None:
         """Separate loop to stop container, because HA loop can't be used."""
         try:
-            await self._container.stop(t=10)
+            await asyncio.wait_for(
+                self._container.stop(t=10), self._timeouts[TIMEOUT_ACTION]
+            )
         except Exception as err:
             _LOGGER.error(
                 "[%s] %s: Can not stop container (%s)",
@@ -1443,7 +3040,9 @@ class DockerContainerAPI:
     async def _restart(self) -> None:
         """Separate loop to stop container, because HA loop can't be used."""
         try:
-            await self._container.restart()
+            await asyncio.wait_for(
+                self._container.restart(), self._timeouts[TIMEOUT_ACTION]
+            )
         except Exception as err:
             _LOGGER.error(
                 "[%s] %s: Can not restart container (%s)",
@@ -1476,18 +3075,104 @@ class DockerContainerAPI:
         return self._name
 
     #############################################################
-    def set_name(self, name: str) -> None:
-        """Set the container name."""
-        self._name = name
+    def _set_interval(self) -> None:
+        """Set the poll intervals, from the (overruled) scan interval."""
+
+        config = self._config
+        self._interval: int = getScanInterval(config, self._name)
+        self._adaptive: bool = config[CONF_ADAPTIVE]
+
+        # An overruled scan interval is also the minimum adaptive interval
+        if self._interval != config[CONF_SCAN_INTERVAL].seconds:
+            self._interval_min: int = self._interval
+        else:
+            self._interval_min: int = config[CONF_ADAPTIVE_MIN] or self._interval
+        self._interval_max: int = max(config[CONF_ADAPTIVE_MAX], self._interval_min)
+        self._poll_interval: int = (
+            self._interval_min if self._adaptive else self._interval
+        )
+
+    #############################################################
+    def get_snapshot(self) -> dict[str, Any] | None:
+        """Counters of the last sample, to continue after a restart."""
+
+        snapshot: dict[str, Any] = {}
+
+        for key, old in (("cpu", self._cpu_old), ("network", self._network_old)):
+            if old:
+                snapshot[key] = old.as_dict()
+
+        return snapshot or None
+
+    #############################################################
+    def restore_snapshot(self, snapshot: dict[str, Any], now: datetime) -> bool:
+        """Restore the counters of a snapshot, if they are recent enough. The
+        first sample can then already calculate the CPU usage and speeds."""
+
+        restored = False
+
+        for key in ("cpu", "network"):
+            old = snapshot.get(key)
+            if not old:
+                continue
+
+            try:
+                read = parser.parse(old["read"])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            if (now - read).total_seconds() > SNAPSHOT_MAX_AGE:
+                continue
+
+            try:
+                if key == "cpu":
+                    self._cpu_old.from_dict(old, read)
+                else:
+                    self._network_old.from_dict(old, read)
+            except KeyError:
+                continue
+
+            restored = True
+
+        if restored:
+            _LOGGER.debug(
+                "[%s] %s: Counters restored from snapshot", self._instance, self._name
+            )
+
+        return restored
+
+    #############################################################
+    def get_id(self) -> str | None:
+        """Return the container id."""
+        return self._container.id if self._container is not None else None
+
+    #############################################################
+    def set_cgroup_stats(self, raw: dict[str, Any] | None) -> None:
+        """Set container stats read from the cgroup files."""
+        self._cgroup_raw = raw
 
     #############################################################
     def get_info(self) -> dict:
         """Return the container info."""
-        return self._info
+        if self._info_view is None:
+            self._info_view = self._info.as_dict()
+        return self._info_view
 
     #############################################################
     def get_stats(self) -> dict:
         """Return the container stats."""
+        if self._stats_view is None:
+            self._stats_view = self._stats.as_dict()
+        return self._stats_view
+
+    #############################################################
+    def get_container_info(self) -> DockerContainerInfo:
+        """Return the container info record, do not modify it."""
+        return self._info
+
+    #############################################################
+    def get_container_stats(self) -> DockerContainerStats:
+        """Return the container stats record, do not modify it."""
         return self._stats
 
     #############################################################
@@ -1503,7 +3188,7 @@ class DockerContainerAPI:
             self._subscribers.append(callback)
 
     #############################################################
-    def _notify(self) -> None:
+    def _notify(self, poll: bool = False) -> None:
         if len(self._subscribers) > 0:
             _LOGGER.debug(
                 "[%s] %s: Send notify (%d) to container",
@@ -1512,8 +3197,18 @@ class DockerContainerAPI:
                 len(self._subscribers),
             )
 
-        for callback in self._subscribers:
-            callback()
+        self._poll_notify = poll
+        try:
+            for callback in self._subscribers:
+                callback()
+        finally:
+            self._poll_notify = False
+
+    #############################################################
+    def notified_by_poll(self) -> bool:
+        """Return if the current notify is of a poll, thus the entity writes
+        can wait until the end of the poll cycle."""
+        return self._poll_notify
 
     #############################################################
     @staticmethod
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import re
+import time
 from datetime import datetime
 from typing import Any
 
@@ -11,22 +12,38 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorEntityDescription,
 )
-from homeassistant.const import CONF_MONITORED_CONDITIONS, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_MONITORED_CONDITIONS,
+    CONF_NAME,
+    CONF_SCAN_INTERVAL,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import slugify
 
 from .const import (
     API,
+    COALESCER,
+    ATTR_CYCLE_DURATION,
+    ATTR_CYCLE_FAILED,
+    ATTR_CYCLE_OVERRUNS,
+    ATTR_CYCLE_SKIPPED,
+    ATTR_CYCLE_STALLED,
     ATTR_MEMORY_LIMIT,
     ATTR_ONLINE_CPUS,
+    ATTR_SAMPLE_EPOCH,
+    ATTR_SAMPLE_TIME,
+    ATTR_STATE_WRITES,
+    ATTR_STATE_WRITES_SKIPPED,
     ATTR_VERSION_ARCH,
     ATTR_VERSION_KERNEL,
     ATTR_VERSION_OS,
     ATTR_VERSION_OS_TYPE,
     CONF_CONTAINERS,
     CONF_CONTAINERS_EXCLUDE,
+    CONF_DEADBAND,
+    CONF_HEARTBEAT,
     CONF_PREFIX,
     CONF_RENAME,
     CONF_RENAME_ENITITY,
@@ -43,8 +60,13 @@ from .const import (
     CONTAINER_INFO_UPTIME,
     CONTAINER_MONITOR_LIST,
     CONTAINER_MONITOR_NETWORK_LIST,
+    CONTAINER_MONITOR_STATS_LIST,
     DOCKER_INFO_VERSION,
     DOCKER_MONITOR_LIST,
+    DOCKER_STATS_1CPU_PERCENTAGE,
+    DOCKER_STATS_CPU_PERCENTAGE,
+    DOCKER_STATS_MEMORY,
+    DOCKER_STATS_MEMORY_PERCENTAGE,
     DOMAIN,
 )
 from .helpers import DockerAPI, DockerContainerAPI
@@ -52,6 +74,15 @@ from .helpers import DockerAPI, DockerContainerAPI
 _LOGGER = logging.getLogger(__name__)
 
 
+def toDeadband(value: float | str | None) -> tuple[float, bool] | None:
+    """Converts a deadband to its size and if it is relative, e.g. 5%."""
+    if value is None:
+        return None
+    if isinstance(value, str) and value.endswith("%"):
+        return float(value[:-1]), True
+    return float(value), False
+
+
 async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
@@ -82,17 +113,27 @@ async def async_setup_platform(
 
     _LOGGER.debug("[%s]: Setting up sensor(s)", instance)
 
+    deadbands = {
+        variable: toDeadband(value) for variable, value in config[CONF_DEADBAND].items()
+    }
+
+    # 1 write coalescer per Docker instance, a reconnect can create a new API
+    coalescer: DockerWriteCoalescer | None = hass.data[DOMAIN][name].get(COALESCER)
+    if coalescer is None or not coalescer.uses(api):
+        coalescer = DockerWriteCoalescer(hass, api, config[CONF_SCAN_INTERVAL].seconds)
+        hass.data[DOMAIN][name][COALESCER] = coalescer
+
     sensors = []
     sensors: list[DockerSensor | DockerContainerSensor] = [
-        DockerSensor(api, instance, prefix, DOCKER_MONITOR_LIST[variable])
+        DockerSensor(api, instance, prefix, DOCKER_MONITOR_LIST[variable], coalescer)
         for variable in config[CONF_MONITORED_CONDITIONS]
         if variable in DOCKER_MONITOR_LIST
         if CONTAINER not in discovery_info
     ]
 
-    # We support add/re-add of a container
+    # We support add/re-add of a batch of containers
     if CONTAINER in discovery_info:
-        clist = [discovery_info[CONTAINER]]
+        clist = discovery_info[CONTAINER]
     else:
         clist = api.list_containers()
 
@@ -155,7 +196,10 @@ async def async_setup_platform(
                         alias_name=find_rename(config[CONF_RENAME], cname),
                         description=CONTAINER_MONITOR_LIST[CONTAINER_INFO_ALLINONE],
                         sensor_name_format=config[CONF_SENSORNAME],
+                        coalescer=coalescer,
                         condition_list=monitor_conditions,
+                        deadbands=deadbands,
+                        heartbeat=config[CONF_HEARTBEAT],
                     )
                 ]
             else:
@@ -183,6 +227,9 @@ async def async_setup_platform(
                                 alias_name=find_rename(config[CONF_RENAME], cname),
                                 description=CONTAINER_MONITOR_LIST[variable],
                                 sensor_name_format=config[CONF_SENSORNAME],
+                                coalescer=coalescer,
+                                deadbands=deadbands,
+                                heartbeat=config[CONF_HEARTBEAT],
                             )
                         ]
 
@@ -197,20 +244,128 @@ async def async_setup_platform(
     return True
 
 
+#################################################################
+class DockerWriteCoalescer:
+    """Collect the sensors with a new state and write them all in 1 event loop
+    callback. During a poll cycle the writes of the polls wait until the end
+    of the cycle, thus the state machine and recorder get 1 burst per cycle."""
+
+    def __init__(self, hass: HomeAssistant, api: DockerAPI, interval: int):
+        """Initialize the write coalescer."""
+
+        self._hass = hass
+        self._api = api
+        self._interval = interval
+        self._dirty: dict[SensorEntity, None] = {}
+        self._scheduled = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes = 0
+        self._skipped = 0
+
+        api.register_cycle_callback(self.flush)
+
+    def uses(self, api: DockerAPI) -> bool:
+        """Return if the coalescer belongs to the given Docker API."""
+        return self._api is api
+
+    @callback
+    def schedule(self, entity: SensorEntity, defer: bool = False) -> None:
+        """Mark the sensor dirty, a sensor is written once per flush. A
+        deferred write, of a poll, waits until the end of the poll cycle.
+        Other writes, e.g. of a Docker event, are done as soon as possible."""
+
+        if entity in self._dirty:
+            self._skipped += 1
+        else:
+            self._dirty[entity] = None
+
+        if self._scheduled:
+            return
+
+        if defer and self._api.in_cycle():
+            # At the latest after the interval, e.g. polling stopped halfway
+            if self._timer is None:
+                self._timer = self._hass.loop.call_later(self._interval, self.flush)
+        else:
+            self._scheduled = True
+            self._hass.loop.call_soon(self.flush)
+
+    @callback
+    def skip(self) -> None:
+        """Count a write which wasn't needed."""
+        self._skipped += 1
+
+    @callback
+    def flush(self) -> None:
+        """Write the state of all dirty sensors."""
+
+        self._scheduled = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        dirty, self._dirty = self._dirty, {}
+
+        for entity in dirty:
+            # Removed or not added (yet)
+            if entity.hass is None or entity.platform is None or entity._removed:
+                self._skipped += 1
+                continue
+
+            try:
+                entity.async_write_ha_state()
+                self._writes += 1
+            except Exception as err:
+                _LOGGER.error(
+                    "Failed 'async_write_ha_state' of %s (%s)",
+                    entity.entity_id,
+                    str(err),
+                )
+
+    def get_counters(self) -> dict[str, int]:
+        """Return the write counters."""
+        return {
+            ATTR_STATE_WRITES: self._writes,
+            ATTR_STATE_WRITES_SKIPPED: self._skipped,
+        }
+
+
 #################################################################
 class DockerSensor(SensorEntity):
     """Representation of a Docker Sensor."""
 
+    # The diagnostic counters of the version sensor change every cycle. They
+    # are not recorded and only written once per docker info pass
+    _diagnostic_attributes = frozenset(
+        {
+            ATTR_CYCLE_DURATION,
+            ATTR_CYCLE_FAILED,
+            ATTR_CYCLE_OVERRUNS,
+            ATTR_CYCLE_SKIPPED,
+            ATTR_CYCLE_STALLED,
+            ATTR_STATE_WRITES,
+            ATTR_STATE_WRITES_SKIPPED,
+        }
+    )
+
+    # The sample of the host totals changes every cycle too, it is only
+    # written together with a new total
+    _unrecorded_attributes = _diagnostic_attributes | {
+        ATTR_SAMPLE_EPOCH,
+        ATTR_SAMPLE_TIME,
+    }
+
     def __init__(
         self,
         api: DockerAPI,
         instance: str,
         prefix: str,
         description: SensorEntityDescription,
+        coalescer: DockerWriteCoalescer,
     ):
         """Initialize the sensor."""
 
         self._api = api
+        self._coalescer = coalescer
         self._instance = instance
         self._prefix = prefix
 
@@ -225,6 +380,7 @@ class DockerSensor(SensorEntity):
 
         self._state = None
         self._attributes: dict[str, Any] = {}
+        self._available = True
         self._removed = False
 
         _LOGGER.info(
@@ -243,7 +399,11 @@ class DockerSensor(SensorEntity):
         """Return the state of the sensor."""
         return self._state
 
-    def update(self) -> None:
+    @property
+    def should_poll(self) -> bool:
+        return False
+
+    def _refresh(self) -> None:
         """Get the latest data for the states."""
         info = self._api.get_info()
 
@@ -255,6 +415,22 @@ class DockerSensor(SensorEntity):
             self._attributes[ATTR_VERSION_OS] = info.get(ATTR_VERSION_OS)
             self._attributes[ATTR_VERSION_OS_TYPE] = info.get(ATTR_VERSION_OS_TYPE)
             self._attributes[ATTR_VERSION_KERNEL] = info.get(ATTR_VERSION_KERNEL)
+            self._attributes[ATTR_CYCLE_DURATION] = info.get(ATTR_CYCLE_DURATION)
+            self._attributes[ATTR_CYCLE_OVERRUNS] = info.get(ATTR_CYCLE_OVERRUNS)
+            self._attributes[ATTR_CYCLE_SKIPPED] = info.get(ATTR_CYCLE_SKIPPED)
+            self._attributes[ATTR_CYCLE_FAILED] = info.get(ATTR_CYCLE_FAILED)
+            self._attributes[ATTR_CYCLE_STALLED] = info.get(ATTR_CYCLE_STALLED)
+            self._attributes.update(self._coalescer.get_counters())
+        elif self.entity_description.key in [
+            DOCKER_STATS_CPU_PERCENTAGE,
+            DOCKER_STATS_1CPU_PERCENTAGE,
+            DOCKER_STATS_MEMORY,
+            DOCKER_STATS_MEMORY_PERCENTAGE,
+        ]:
+            # The totals are a snapshot of 1 poll cycle
+            self._state = info.get(self.entity_description.key)
+            self._attributes[ATTR_SAMPLE_EPOCH] = info.get(ATTR_SAMPLE_EPOCH)
+            self._attributes[ATTR_SAMPLE_TIME] = info.get(ATTR_SAMPLE_TIME)
         else:
             self._state = info.get(self.entity_description.key)
 
@@ -263,12 +439,32 @@ class DockerSensor(SensorEntity):
         """Return the state attributes."""
         return self._attributes
 
+    @property
+    def available(self) -> bool:
+        """Return if the connection with Docker is working."""
+        return self._available
+
+    def _compared_attributes(
+        self, attributes: dict[str, Any], diagnostics: bool
+    ) -> dict[str, Any]:
+        """Return the attributes which are compared to detect a change."""
+        return {
+            key: value
+            for key, value in attributes.items()
+            if key not in self._unrecorded_attributes
+            or (diagnostics and key in self._diagnostic_attributes)
+        }
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         self._api.register_callback(self.event_callback, self.entity_description.key)
 
-    def event_callback(self, remove=False) -> None:
-        """Callback to remove Docker entity."""
+        # Call event callback for possible information available
+        self.event_callback()
+
+    def event_callback(self, remove=False, diagnostics=False) -> None:
+        """Callback for update of Docker information, or to remove the entity.
+        The diagnostic counters are only compared if asked for."""
 
         # If already called before, do not remove it again
         if self._removed:
@@ -284,11 +480,32 @@ class DockerSensor(SensorEntity):
             self._removed = True
             return
 
+        state = self._state
+        attributes = dict(self._attributes)
+
+        self._refresh()
+        available = self._api.is_available()
+
+        compared = self._compared_attributes
+        changed = compared(self._attributes, diagnostics) != compared(
+            attributes, diagnostics
+        )
+
+        if self._state != state or changed or available != self._available:
+            self._available = available
+            self._coalescer.schedule(self)
+        else:
+            self._coalescer.skip()
+
 
 #################################################################
 class DockerContainerSensor(SensorEntity):
     """Representation of a Docker Sensor."""
 
+    # The stats change every poll, keep them out of the recorder history of
+    # the allinone sensor. The stats sensors itself have no such attributes
+    _unrecorded_attributes = frozenset(CONTAINER_MONITOR_STATS_LIST)
+
     def __init__(
         self,
         container: DockerContainerAPI,
@@ -299,12 +516,19 @@ class DockerContainerSensor(SensorEntity):
         alias_name: str,
         description: SensorEntityDescription,
         sensor_name_format: str,
+        coalescer: DockerWriteCoalescer,
         condition_list: list | None = None,
+        deadbands: dict[str, tuple[float, bool] | None] | None = None,
+        heartbeat: int = 0,
     ):
         """Initialize the sensor."""
 
         self._instance = instance
         self._container = container
+        self._coalescer = coalescer
+        self._deadbands = deadbands or {}
+        self._heartbeat = heartbeat
+        self._written = 0.0
         self._prefix = prefix
         self._cname = cname
         self._condition_list = condition_list
@@ -337,6 +561,7 @@ class DockerContainerSensor(SensorEntity):
         self._state_extra = None
 
         self._attr_extra_state_attributes: dict[str, Any] = {}
+        self._attr_available = True
         self._removed = False
 
         _LOGGER.info(
@@ -379,6 +604,30 @@ class DockerContainerSensor(SensorEntity):
         """Return the state of the sensor."""
         return self._state
 
+    def _significant(self, key: str, value: Any, old: Any) -> bool:
+        """Check if a value changed, for numeric values the change must be
+        outside the deadband, or the last write is older than the heartbeat."""
+
+        if value == old:
+            return False
+
+        deadband = self._deadbands.get(key)
+        if deadband is None:
+            return True
+
+        # Always write from/to unknown, e.g. container stopped
+        if not isinstance(value, (int, float)) or not isinstance(old, (int, float)):
+            return True
+
+        if self._heartbeat and time.monotonic() - self._written >= self._heartbeat:
+            return True
+
+        band, relative = deadband
+        if relative:
+            band = abs(old) * band / 100
+
+        return abs(value - old) > band
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         self._container.register_callback(
@@ -407,6 +656,7 @@ class DockerContainerSensor(SensorEntity):
             return
 
         state = None
+        attributes: dict[str, Any] = {}
 
         _LOGGER.debug(
             "[%s] %s: Received callback for: %s",
@@ -436,7 +686,6 @@ class DockerContainerSensor(SensorEntity):
                 state = info.get(CONTAINER_INFO_STATE)
 
                 # Now list the rest of the attributes
-                self._attr_extra_state_attributes = {}
                 for cond in self._condition_list:
                     if cond in [
                         CONTAINER_INFO_STATUS,
@@ -445,9 +694,9 @@ class DockerContainerSensor(SensorEntity):
                         CONTAINER_INFO_HEALTH,
                         CONTAINER_INFO_UPTIME,
                     ]:
-                        self._attr_extra_state_attributes[cond] = info.get(cond, None)
+                        attributes[cond] = info.get(cond, None)
                     else:
-                        self._attr_extra_state_attributes[cond] = stats.get(cond, None)
+                        attributes[cond] = stats.get(cond, None)
             elif self.entity_description.key == CONTAINER_INFO_STATUS:
                 state = info.get(CONTAINER_INFO_STATUS)
                 self._state_extra = info.get(CONTAINER_INFO_STATE)
@@ -467,18 +716,25 @@ class DockerContainerSensor(SensorEntity):
                     else:
                         state = stats.get(self.entity_description.key)
 
-        if (
-            state != self._state
-            or self.entity_description.key == CONTAINER_INFO_ALLINONE
-        ):
+        available = self._container.is_available()
+
+        changed = self._significant(self.entity_description.key, state, self._state)
+
+        # Allinone, compare the attributes with the last written ones
+        if not changed and self.entity_description.key == CONTAINER_INFO_ALLINONE:
+            old = self._attr_extra_state_attributes
+            changed = attributes.keys() != old.keys() or any(
+                self._significant(cond, value, old.get(cond))
+                for cond, value in attributes.items()
+            )
+
+        if changed or available != self._attr_available:
             self._state = state
+            if self.entity_description.key == CONTAINER_INFO_ALLINONE:
+                self._attr_extra_state_attributes = attributes
+            self._attr_available = available
+            self._written = time.monotonic()
 
-            try:
-                self.schedule_update_ha_state()
-            except Exception as err:
-                _LOGGER.error(
-                    "[%s] %s: Failed 'schedule_update_ha_state' (%s)",
-                    self._instance,
-                    self._cname,
-                    str(err),
-                )
+            self._coalescer.schedule(self, self._container.notified_by_poll())
+        else:
+            self._coalescer.skip()
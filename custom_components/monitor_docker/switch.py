@@ -111,9 +111,9 @@ async def async_setup_platform(
 
     switches = []
 
-    # We support add/re-add of a container
+    # We support add/re-add of a batch of containers
     if CONTAINER in discovery_info:
-        clist = [discovery_info[CONTAINER]]
+        clist = discovery_info[CONTAINER]
     else:
         clist = api.list_containers()
 
@@ -187,6 +187,7 @@ class DockerContainerSwitch(SwitchEntity):
             slugify(f"{self._prefix}_{alias_entityid}")
         )
         self._name = name_format.format(name=alias_name)
+        self._attr_available = True
         self._removed = False
 
     @property
@@ -260,6 +261,9 @@ class DockerContainerSwitch(SwitchEntity):
             if info is not None:
                 state = info.get(CONTAINER_INFO_STATE) == "running"
 
-        if state is not self._state:
+        available = self._container.is_available()
+
+        if state is not self._state or available != self._attr_available:
             self._state = state
+            self._attr_available = available
             self.async_schedule_update_ha_state()
@@ -0,0 +1,133 @@
+"""Tests of the Monitor Docker cgroup v2 collector, against a fake cgroup tree."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# The collector has no Home Assistant dependencies, load it without the package
+_SPEC = importlib.util.spec_from_file_location(
+    "monitor_docker_cgroup",
+    Path(__file__).parents[1] / "custom_components" / "monitor_docker" / "cgroup.py",
+)
+cgroup = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(cgroup)
+
+SYSTEMD_ID = "a" * 64
+CGROUPFS_ID = "b" * 64
+
+PROC_STAT = (
+    "cpu  100 20 30 400 50 6 7 80 0 0\n"
+    "cpu0 50 10 15 200 25 3 3 40 0 0\n"
+    "cpu1 50 10 15 200 25 3 4 40 0 0\n"
+    "intr 12345\n"
+)
+MEMINFO = "MemTotal:       8000000 kB\nMemFree:        1000000 kB\n"
+NET_DEV = (
+    "Inter-|   Receive                            |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes\n"
+    "    lo:  999 1 0 0 0 0 0 0  999 1 0 0 0 0 0 0\n"
+    "  eth0: 1000 10 0 0 0 0 0 0 2000 20 0 0 0 0 0 0\n"
+    "  eth1:  300  3 0 0 0 0 0 0  400  4 0 0 0 0 0 0\n"
+)
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _container(path: Path, usage_usec: int, memory_max: str, cpus: str) -> None:
+    _write(path / "cpu.stat", f"usage_usec {usage_usec}\nuser_usec 1\nsystem_usec 2\n")
+    _write(path / "memory.stat", "anon 100\ninactive_file 4096\n")
+    _write(path / "memory.current", "1048576\n")
+    _write(path / "memory.max", f"{memory_max}\n")
+    _write(path / "cpuset.cpus.effective", f"{cpus}\n")
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> tuple[Path, Path]:
+    root = tmp_path / "cgroup"
+    proc = tmp_path / "proc"
+
+    _write(proc / "stat", PROC_STAT)
+    _write(proc / "meminfo", MEMINFO)
+    _write(proc / "1234" / "net" / "dev", NET_DEV)
+
+    # systemd cgroup driver, with a visible process
+    systemd = root / "system.slice" / f"docker-{SYSTEMD_ID}.scope"
+    _container(systemd, 5000, "2097152", "0-3,6")
+    _write(systemd / "cgroup.procs", "1234\n1235\n")
+
+    # cgroupfs driver, without processes and memory limit
+    cgroupfs = root / "docker" / CGROUPFS_ID
+    _container(cgroupfs, 7000, "max", "")
+    _write(cgroupfs / "cgroup.procs", "")
+
+    # Not a Docker container
+    _container(root / "system.slice" / "cron.service", 1, "max", "0")
+
+    return root, proc
+
+
+def test_collect_systemd(tree: tuple[Path, Path]) -> None:
+    root, proc = tree
+    collector = cgroup.CgroupCollector(str(root), str(proc))
+
+    raw = collector.collect([SYSTEMD_ID])[SYSTEMD_ID]
+
+    # Docker sums user up to softirq, without steal
+    ticks = 100 + 20 + 30 + 400 + 50 + 6 + 7
+    # The system CPU time covers all host CPUs, thus not the cpuset count
+    assert raw["cpu_stats"] == {
+        "cpu_usage": {"total_usage": 5000 * 1000},
+        "system_cpu_usage": ticks * 1_000_000_000 // collector._clk_tck,
+        "online_cpus": 2,
+    }
+    assert raw["memory_stats"]["usage"] == 1048576
+    assert raw["memory_stats"]["limit"] == 2097152
+    assert raw["memory_stats"]["stats"]["inactive_file"] == 4096
+    assert raw["networks"] == {
+        "eth0": {"rx_bytes": 1000, "tx_bytes": 2000},
+        "eth1": {"rx_bytes": 300, "tx_bytes": 400},
+    }
+    assert "read" in raw
+    assert "blkio_stats" not in raw
+
+
+def test_collect_cgroupfs(tree: tuple[Path, Path]) -> None:
+    root, proc = tree
+    collector = cgroup.CgroupCollector(str(root), str(proc))
+
+    raw = collector.collect([CGROUPFS_ID])[CGROUPFS_ID]
+
+    assert raw["cpu_stats"]["cpu_usage"]["total_usage"] == 7000 * 1000
+    assert raw["cpu_stats"]["online_cpus"] == 2
+    # No memory limit, thus the host memory
+    assert raw["memory_stats"]["limit"] == 8000000 * 1024
+    # No process visible, thus no network counters
+    assert "networks" not in raw
+
+
+def test_collect_unknown(tree: tuple[Path, Path]) -> None:
+    root, proc = tree
+    collector = cgroup.CgroupCollector(str(root), str(proc))
+
+    result = collector.collect([SYSTEMD_ID, "c" * 64])
+
+    assert list(result) == [SYSTEMD_ID]
+
+
+def test_collect_missing_root(tmp_path: Path) -> None:
+    collector = cgroup.CgroupCollector(str(tmp_path / "none"), str(tmp_path))
+
+    assert collector.collect([SYSTEMD_ID]) == {}
+
+
+def test_collect_missing_proc_stat(tree: tuple[Path, Path]) -> None:
+    root, proc = tree
+    (proc / "stat").unlink()
+    collector = cgroup.CgroupCollector(str(root), str(proc))
+
+    # Without system CPU time, the containers fall back to the Docker API
+    assert collector.collect([SYSTEMD_ID, CGROUPFS_ID]) == {}
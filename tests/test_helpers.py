@@ -0,0 +1,382 @@
+"""Tests of the Monitor Docker helpers: scheduler, event queue and backoff."""
+
+import asyncio
+import re
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiodocker")
+
+from homeassistant.const import CONF_SCAN_INTERVAL  # noqa: E402
+
+from custom_components.monitor_docker import helpers  # noqa: E402
+from custom_components.monitor_docker.const import (  # noqa: E402
+    ATTR_CYCLE_FAILED,
+    ATTR_CYCLE_OVERRUNS,
+    ATTR_CYCLE_SKIPPED,
+    ATTR_CYCLE_STALLED,
+    CONF_SCAN_INTERVALS,
+)
+
+# Scheduler tick in seconds, small to keep the tests fast
+TICK = 0.1
+
+
+class FakeContainer:
+    """Container with a fixed poll interval, duration and result."""
+
+    def __init__(self, name: str, interval: float, duration=0.0, result=True):
+        self.name = name
+        self.interval = interval
+        self.duration = duration
+        self.result = result
+        self.cycles: list[float] = []
+        self.active = 0
+        self.max_active = 0
+        self._next = 0.0
+
+    def get_name(self) -> str:
+        return self.name
+
+    def poll_due(self, cycle: float) -> bool:
+        return cycle + 0.01 >= self._next
+
+    async def poll(self, cycle: float) -> bool:
+        self.cycles.append(cycle)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.duration)
+        finally:
+            self.active -= 1
+        self._next = cycle + self.interval
+        return self.result
+
+
+def _ticks(container: FakeContainer, first: float) -> list[int]:
+    """The ticks a container was polled at."""
+    return [round((cycle - first) / TICK) for cycle in container.cycles]
+
+
+async def _run(scheduler: helpers.DockerScheduler, seconds: float) -> None:
+    scheduler.start()
+    await asyncio.sleep(seconds)
+    await asyncio.wait(scheduler.stop())
+
+
+def _scheduler(interval: float, pre_cycle=None, post_cycle=None, timeout=5.0):
+    return helpers.DockerScheduler(
+        "test", interval, 10, pre_cycle, post_cycle, timeout, TICK
+    )
+
+
+#################################################################
+def test_scheduler_intervals() -> None:
+    """A container is polled at its own interval, also if it isn't a multiple
+    of the scan interval."""
+
+    async def run() -> None:
+        fast = FakeContainer("fast", TICK)
+        normal = FakeContainer("normal", 2 * TICK)
+        slow = FakeContainer("slow", 3 * TICK)
+
+        scheduler = _scheduler(2 * TICK)
+        for container in (fast, normal, slow):
+            scheduler.add(container)
+        await _run(scheduler, 9.5 * TICK)
+
+        first = fast.cycles[0]
+        assert _ticks(fast, first)[:8] == [0, 1, 2, 3, 4, 5, 6, 7]
+        assert _ticks(normal, first)[:4] == [0, 2, 4, 6]
+        assert _ticks(slow, first)[:3] == [0, 3, 6]
+
+    asyncio.run(run())
+
+
+def test_scheduler_cycle_work() -> None:
+    """The pre-cycle only gets the due containers, the post-cycle runs once
+    per scan interval."""
+
+    async def run() -> None:
+        pre: list[list[str]] = []
+        post: list[int] = []
+
+        async def pre_cycle(containers: list) -> bool:
+            pre.append(sorted(container.get_name() for container in containers))
+            return True
+
+        scheduler = _scheduler(3 * TICK, pre_cycle, post.append)
+        scheduler.add(FakeContainer("fast", TICK))
+        scheduler.add(FakeContainer("normal", 3 * TICK))
+        await _run(scheduler, 5.5 * TICK)
+
+        assert pre[:4] == [["fast", "normal"], ["fast"], ["fast"], ["fast", "normal"]]
+        assert post == [1, 2]
+
+    asyncio.run(run())
+
+
+def test_scheduler_overrun() -> None:
+    """A poll which doesn't finish within the cycle keeps running, the
+    container is skipped until it is done."""
+
+    async def run() -> None:
+        slow = FakeContainer("slow", TICK, duration=3.5 * TICK)
+        fast = FakeContainer("fast", TICK)
+
+        scheduler = _scheduler(TICK)
+        scheduler.add(slow)
+        scheduler.add(fast)
+        await _run(scheduler, 6 * TICK)
+
+        assert slow.max_active == 1
+        assert len(slow.cycles) == 2
+        assert len(fast.cycles) >= 5
+        assert scheduler.get_counters()[ATTR_CYCLE_OVERRUNS] == 2
+
+    asyncio.run(run())
+
+
+def test_scheduler_skip() -> None:
+    """The pre-cycle can skip a cycle, e.g. when the Docker host is sick."""
+
+    async def run() -> None:
+        post: list[int] = []
+
+        async def pre_cycle(containers: list) -> bool:
+            return False
+
+        container = FakeContainer("container", TICK)
+        scheduler = _scheduler(TICK, pre_cycle, post.append)
+        scheduler.add(container)
+        await _run(scheduler, 3.5 * TICK)
+
+        assert container.cycles == []
+        assert post == []
+        assert scheduler.get_counters()[ATTR_CYCLE_SKIPPED] == 4
+
+    asyncio.run(run())
+
+
+def test_scheduler_timeout() -> None:
+    """A poll is cancelled after the timeout, and counted as failed."""
+
+    async def run() -> None:
+        container = FakeContainer("container", TICK, duration=10)
+        scheduler = _scheduler(TICK, timeout=1.5 * TICK)
+        scheduler.add(container)
+        await _run(scheduler, 3.5 * TICK)
+
+        assert container.active == 0
+        assert scheduler.get_counters()[ATTR_CYCLE_FAILED] >= 1
+
+    asyncio.run(run())
+
+
+def test_scheduler_error() -> None:
+    """An error of the post-cycle, e.g. an entity callback, doesn't stop
+    the polling."""
+
+    async def run() -> None:
+        def post_cycle(epoch: int) -> None:
+            raise RuntimeError("entity callback")
+
+        container = FakeContainer("container", TICK)
+        scheduler = _scheduler(TICK, post_cycle=post_cycle)
+        scheduler.add(container)
+        await _run(scheduler, 3.5 * TICK)
+
+        assert len(container.cycles) == 4
+
+    asyncio.run(run())
+
+
+def test_scheduler_restart() -> None:
+    """The loop is restarted when it ended, but not after a stop."""
+
+    async def run() -> None:
+        scheduler = _scheduler(TICK)
+        assert not scheduler.restart()
+
+        scheduler.start()
+        await asyncio.sleep(0)
+        scheduler._task.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.restart()
+
+        scheduler.stop()
+        assert not scheduler.restart()
+
+    asyncio.run(run())
+
+
+def test_scheduler_stalled() -> None:
+    """A loop which hangs, e.g. in the pre-cycle, is restarted."""
+
+    async def run() -> None:
+        calls = 0
+
+        async def pre_cycle(containers: list) -> bool:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                await asyncio.sleep(100)
+            return True
+
+        container = FakeContainer("container", TICK)
+        scheduler = _scheduler(TICK, pre_cycle)
+        scheduler.add(container)
+        scheduler.start()
+
+        await asyncio.sleep(3.5 * TICK)
+        assert not scheduler.restart_stalled(10 * TICK)
+        assert scheduler.restart_stalled(2 * TICK)
+        assert len(container.cycles) == 1
+
+        await asyncio.sleep(2.5 * TICK)
+        await asyncio.wait(scheduler.stop())
+
+        assert len(container.cycles) == 4
+        assert scheduler.get_counters()[ATTR_CYCLE_STALLED] == 1
+
+    asyncio.run(run())
+
+
+#################################################################
+class FakeEventQueue:
+    """The event queue of the Docker API, with a batch of a fixed duration."""
+
+    def __init__(self, duration=0.0):
+        self.api = helpers.DockerAPI.__new__(helpers.DockerAPI)
+        self.api._tasks = {}
+        self.api._event_first = None
+        self.api._event_timer = None
+        self.api._container_create_destroy = self._batch
+        self.batches: list[float] = []
+        self.runs = 0
+        self.duration = duration
+
+        run_event_queue = self.api._run_event_queue
+
+        def counted() -> None:
+            self.runs += 1
+            run_event_queue()
+
+        self.api._run_event_queue = counted
+
+    async def _batch(self) -> None:
+        self.batches.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(self.duration)
+
+
+@pytest.fixture
+def event_delays(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(helpers, "EVENT_QUIET_PERIOD", TICK)
+    monkeypatch.setattr(helpers, "EVENT_MAX_DELAY", 4 * TICK)
+
+
+def test_event_queue_quiet_period(event_delays: None) -> None:
+    """A burst of events is handled in 1 batch, after a quiet period."""
+
+    async def run() -> None:
+        queue = FakeEventQueue()
+        start = asyncio.get_running_loop().time()
+
+        for _ in range(5):
+            queue.api._queue_event()
+            await asyncio.sleep(TICK / 2)
+
+        await asyncio.sleep(2 * TICK)
+
+        assert len(queue.batches) == 1
+        assert queue.batches[0] - start >= 3 * TICK
+
+    asyncio.run(run())
+
+
+def test_event_queue_max_delay(event_delays: None) -> None:
+    """A continuous stream of events is handled after the max delay."""
+
+    async def run() -> None:
+        queue = FakeEventQueue()
+        start = asyncio.get_running_loop().time()
+
+        for _ in range(12):
+            queue.api._queue_event()
+            await asyncio.sleep(TICK / 2)
+
+        assert queue.batches
+        assert queue.batches[0] - start < 5 * TICK
+
+    asyncio.run(run())
+
+
+def test_event_queue_busy(event_delays: None) -> None:
+    """With the previous batch still busy, the queue retries after the quiet
+    period instead of every event loop iteration."""
+
+    async def run() -> None:
+        queue = FakeEventQueue(duration=10 * TICK)
+
+        queue.api._queue_event()
+        await asyncio.sleep(1.5 * TICK)
+        assert len(queue.batches) == 1
+
+        # Past the max delay while the batch is busy
+        queue.api._queue_event()
+        await asyncio.sleep(6 * TICK)
+        assert len(queue.batches) == 1
+        assert queue.runs < 10
+
+        await asyncio.sleep(5 * TICK)
+        assert len(queue.batches) == 2
+
+    asyncio.run(run())
+
+
+#################################################################
+def test_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(helpers.random, "uniform", lambda low, high: 1.0)
+    backoff = helpers.DockerBackoff(10, maximum=30, threshold=2)
+
+    assert backoff.allow()
+    assert backoff.failure() == 10
+    assert not backoff.is_open()
+    assert backoff.allow()
+
+    assert backoff.failure() == 20
+    assert backoff.is_open()
+    assert not backoff.allow()
+
+    assert backoff.failure() == 30
+    assert backoff.failures == 3
+
+    assert backoff.success()
+    assert not backoff.is_open()
+    assert backoff.allow()
+
+
+def test_get_scan_interval() -> None:
+    config = {
+        CONF_SCAN_INTERVAL: timedelta(seconds=10),
+        CONF_SCAN_INTERVALS: {
+            re.compile("db"): timedelta(seconds=2),
+            re.compile("ci-.*"): timedelta(seconds=60),
+            re.compile("db.*"): timedelta(seconds=5),
+        },
+    }
+
+    assert helpers.getScanInterval(config, "db") == 2
+    assert helpers.getScanInterval(config, "db2") == 5
+    assert helpers.getScanInterval(config, "ci-runner") == 60
+    assert helpers.getScanInterval(config, "my-ci-runner") == 10
+
+
+@pytest.mark.parametrize(
+    ("value", "version"),
+    [("1.41", (1, 41)), ("1.43.1", (1, 43)), ("1", (0, 0)), (None, (0, 0))],
+)
+def test_to_api_version(value: str | None, version: tuple[int, int]) -> None:
+    assert helpers.toApiVersion(value) == version
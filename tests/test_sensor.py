@@ -0,0 +1,55 @@
+"""Tests of the Monitor Docker sensor deadband and heartbeat."""
+
+import time
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiodocker")
+
+from custom_components.monitor_docker import sensor  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("value", "deadband"),
+    [(None, None), (0.5, (0.5, False)), (2, (2.0, False)), ("5%", (5.0, True))],
+)
+def test_to_deadband(value, deadband) -> None:
+    assert sensor.toDeadband(value) == deadband
+
+
+def _sensor(heartbeat: int = 0, written: float = 0.0) -> sensor.DockerContainerSensor:
+    entity = sensor.DockerContainerSensor.__new__(sensor.DockerContainerSensor)
+    entity._deadbands = {"cpu": (1.0, False), "memory": (10.0, True)}
+    entity._heartbeat = heartbeat
+    entity._written = written
+    return entity
+
+
+def test_significant_absolute() -> None:
+    entity = _sensor()
+
+    assert not entity._significant("cpu", 5.0, 5.0)
+    assert not entity._significant("cpu", 5.5, 5.0)
+    assert entity._significant("cpu", 6.5, 5.0)
+
+
+def test_significant_relative() -> None:
+    entity = _sensor()
+
+    assert not entity._significant("memory", 105.0, 100.0)
+    assert entity._significant("memory", 111.0, 100.0)
+
+
+def test_significant_other() -> None:
+    entity = _sensor()
+
+    # Without deadband, from/to unknown or not numeric
+    assert entity._significant("state", "exited", "running")
+    assert entity._significant("cpu", None, 5.0)
+    assert entity._significant("cpu", 5.0, None)
+
+
+def test_significant_heartbeat() -> None:
+    assert not _sensor(60, time.monotonic())._significant("cpu", 5.5, 5.0)
+    assert _sensor(60, time.monotonic() - 61)._significant("cpu", 5.5, 5.0)